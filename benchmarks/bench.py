@@ -0,0 +1,138 @@
+"""
+Benchmarks for ttcal (not part of the test suite).
+
+Run all benchmarks with ``python benchmarks/bench.py``, or some of them
+with e.g. ``python benchmarks/bench.py memory``.  The numbers depend on
+the machine and the Python version, so only compare runs made on the
+same machine.
+"""
+import datetime
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ttcal  # noqa: E402 pylint:disable=wrong-import-position
+
+BENCHMARKS = {}
+
+
+def benchmark(fn):
+    """Register `fn` as a benchmark.
+    """
+    BENCHMARKS[fn.__name__] = fn
+    return fn
+
+
+def timed(fn, *args):
+    """Return the best time (in ms) of 5 calls to `fn(*args)`.
+    """
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def bytes_per_object(factory, n):
+    """Return the average number of bytes allocated (and retained) by
+       `factory`, over `n` calls.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objs = [factory(i) for i in range(n)]
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    assert len(objs) == n
+    return size / n
+
+
+@benchmark
+def memory():
+    """Bytes per Day, Week, Month, and Year object.
+    """
+    sizes = {
+        'Day': bytes_per_object(lambda i: ttcal.Day.fromordinal(730000 + i), 10000),
+        'Week': bytes_per_object(lambda i: ttcal.Week.weeknum(i % 52 + 1, 2000 + i // 52), 1000),
+        'Month': bytes_per_object(lambda i: ttcal.Month(2000 + i // 12, i % 12 + 1), 240),
+        'Year': bytes_per_object(lambda i: ttcal.Year(2000 + i), 20),
+    }
+    for name, size in sizes.items():
+        print(f'  {name:>6}: {size:10.0f} bytes/object')
+
+
+@benchmark
+def marks():
+    """5000 Year.mark calls and a 92 day Year.mark_period.
+    """
+    def run():
+        y = ttcal.Year(2024)
+        first = y.first.toordinal()
+        for i in range(5000):
+            y.mark(ttcal.Day.fromordinal(first + i % 366), str(i % 10))
+        y.mark_period(ttcal.Days(ttcal.Day(2024, 3, 1), ttcal.Day(2024, 5, 31)), 'absent')
+        return list(y.marked_days())
+    print(f'  {timed(run):.1f}ms')
+
+
+@benchmark
+def render():
+    """Rendering hrs/mins/secs/str of 20000 timesheet Durations.
+    """
+    from ttcal.duration import _decompose  # pylint:disable=import-outside-toplevel
+
+    class Uncached(ttcal.Duration):
+        # duration_tuple() as it was before the decomposition was cached
+        def duration_tuple(self):
+            return _decompose(self.toint())
+
+    def cells(rows):
+        return [f'<td>{d.hrs}</td><td>{d.mins:02d}</td><td>{d.secs:02d}</td><td>{d}</td>' for d in rows]
+
+    def bulk(rows):
+        return [f'<td>{h}</td><td>{m:02d}</td><td>{sc:02d}</td><td>{sign}{h}:{m:02d}:{sc:02d}</td>'
+                for sign, h, m, sc in ttcal.Duration.decompose_many(rows)]
+
+    secs = [n * 37 for n in range(20000)]
+    # new objects for each run, so the cached decomposition starts empty.
+    print(f'  uncached:       {timed(lambda: cells([Uncached(seconds=s) for s in secs])):.1f}ms')
+    print(f'  cached:         {timed(lambda: cells([ttcal.Duration(seconds=s) for s in secs])):.1f}ms')
+    print(f'  decompose_many: {timed(lambda: bulk([ttcal.Duration(seconds=s) for s in secs])):.1f}ms')
+
+
+@benchmark
+def grouping():
+    """Counting 2 x 10 years of Day/date dict keys, grouped by month.
+    """
+    days = ttcal.Days(ttcal.Day(2015, 1, 1), ttcal.Day(2024, 12, 31))
+    dates = [d.toordinal() for d in days]
+
+    def run():
+        counts = {}
+        for d in days:
+            counts[d] = counts.get(d, 0) + 1
+        for n in dates:
+            dt = datetime.date.fromordinal(n)
+            counts[dt] = counts.get(dt, 0) + 1
+        by_month = {}
+        for d in counts:
+            by_month.setdefault(d.Month, []).append(d)
+        return by_month
+    print(f'  {timed(run):.1f}ms')
+
+
+def main(names):
+    for name in names or BENCHMARKS:
+        print(f'{name}: {BENCHMARKS[name].__doc__.strip()}')
+        BENCHMARKS[name]()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,3 +1,4 @@
+import pytest
 import ttcal
 
 
@@ -69,3 +70,22 @@ def test_add_month_lastday():
     print("(d + 1m) + 1m =", (feb29 + months1) + months1)
     assert feb29 + months1 == ttcal.Day(2020, 3, 29)
     assert (feb29 + months1) + months1 == ttcal.Day(2020, 4, 29)
+
+
+def test_add_to_many():
+    np = pytest.importorskip('numpy')
+    days = ttcal.Days(ttcal.Day(2019, 12, 1), ttcal.Day(2024, 3, 31))
+    for period in [ttcal.Period(months=1), ttcal.Period(years=1, months=3),
+                   ttcal.Period(years=4), ttcal.Period(months=-14), ttcal.Period()]:
+        added = period.add_to_many(days)
+        assert isinstance(added, ttcal.DayArray)
+        assert added.tolist() == [period.add_to_day(ttcal.Day, d) for d in days]
+        subtracted = period.sub_from_many(days)
+        assert subtracted.tolist() == [period.sub_from_day(ttcal.Day, d) for d in days]
+
+    ordinals = np.array([ttcal.Day(2020, 1, 31).toordinal(), ttcal.Day(2020, 2, 29).toordinal()], dtype=np.int32)
+    res = ttcal.Period(months=1).add_to_many(ordinals)
+    assert res.dtype == np.int32
+    assert res.tolist() == [ttcal.Day(2020, 2, 29).toordinal(), ttcal.Day(2020, 3, 29).toordinal()]
+    assert ttcal.Period(years=1).add_to_many([ttcal.Day(2020, 2, 29)]).tolist() == [ttcal.Day(2021, 2, 28)]
+    assert ttcal.Period(months=1).sub_from_many(ttcal.DayArray.from_period(ttcal.Month(2020, 3)))[-1] == ttcal.Day(2020, 2, 29)
@@ -1,4 +1,9 @@
-from ttcal.calfns import rangecmp
+from datetime import date, datetime
+import ttcal
+import calendar
+import re
+from ttcal.calfns import (rangecmp, spancmp, span, periodcmp, isocalendar, isoweek_start, isoweek, month_grid,
+                          days_in_month, month_serial, serial_month, quarter_serial, serial_quarter)
 
 
 def test_rangecmp():
@@ -8,3 +13,83 @@ def test_rangecmp():
     assert rangecmp((1, 5), (3, 4)) == 0   # (3,4) contained in (1,5)
     assert rangecmp((1, 2), (2, 4)) == -1  # (1,2) less than and doesn't overlap (2,4)
     assert rangecmp((3, 4), (1, 5)) == 0   # (3,4) contained in (1,5)
+
+
+def test_spancmp():
+    assert spancmp((1, 2), (1, 2)) == 0   # identical
+    assert spancmp((3, 4), (1, 2)) == 1   # (3,4)>(1,2)
+    assert spancmp((1, 4), (3, 5)) == 0   # overlap
+    assert spancmp((1, 5), (3, 4)) == 0   # (3,4) contained in (1,5)
+    assert spancmp((1, 2), (2, 4)) == -1  # (1,2) less than and doesn't overlap (2,4)
+    assert spancmp((3, 4), (1, 5)) == 0   # (3,4) contained in (1,5)
+
+
+def test_span():
+    d = date(2015, 2, 1)
+    assert span(d) == (d.toordinal(), d.toordinal() + 1)
+    assert span(datetime(2015, 2, 1, 12)) == span(d)
+    assert span(ttcal.Day(2015, 2, 1)) == span(d)
+    assert span(ttcal.Month(2015, 2)) == (d.toordinal(), d.toordinal() + 28)
+    assert span(ttcal.Year(2016))[1] - span(ttcal.Year(2016))[0] == 366
+    assert span(ttcal.Quarter(2015, 1)) == (ttcal.Day(2015, 1, 1).toordinal(),
+                                            ttcal.Day(2015, 4, 1).toordinal())
+    assert span(ttcal.Week.weeknum(5, 2015))[1] - span(ttcal.Week.weeknum(5, 2015))[0] == 7
+    assert span(None) is None
+    assert span(re.match('a', 'a')) is None
+
+
+def test_periodcmp():
+    class Foreign:
+        def rangetuple(self):
+            return datetime(2015, 2, 1, 12), datetime(2015, 2, 2, 12)
+
+    m = ttcal.Month(2015, 2)
+    assert periodcmp(m, Foreign()) == 0
+    assert periodcmp(m - 1, Foreign()) == -1
+    assert periodcmp(m, ttcal.Day(2015, 3, 1)) == -1
+    assert periodcmp(m, None) is None
+    assert periodcmp(m, re.match('a', 'a')) is None
+    assert m != re.match('a', 'a')
+    assert not m == re.match('a', 'a')
+
+
+def test_isocalendar():
+    for d in [date(2008, 12, 29), date(2009, 12, 31), date(2010, 1, 3),
+              date(2015, 12, 31), date(2016, 1, 4), date(2020, 12, 31), date(1, 1, 1)]:
+        assert isocalendar(d.toordinal(), d.year) == tuple(d.isocalendar())
+        assert isocalendar(d.toordinal()) == tuple(d.isocalendar())
+
+
+def test_isoweek_start():
+    assert isoweek_start(2009, 1) == date(2008, 12, 29).toordinal()
+    assert isoweek_start(2009, 53) == date(2009, 12, 28).toordinal()
+    assert isoweek_start(2016, 1) == date(2016, 1, 4).toordinal()
+    assert [d.day for d in isoweek(2016, 1)] == [4, 5, 6, 7, 8, 9, 10]
+
+
+def test_month_grid():
+    for firstweekday in (0, 6):
+        cal = calendar.Calendar(firstweekday)
+        for year in (2020, 2021, 2026):
+            for month in range(1, 13):
+                days = list(cal.itermonthdates(year, month))
+                grid = month_grid(year, month, firstweekday)
+                assert grid.start == days[0].toordinal()
+                assert grid.end == days[-1].toordinal() + 1
+                assert grid.weeks == tuple(d.isocalendar()[:2] for d in days[3::7])
+    assert month_grid(2024, 3) is month_grid(2024, 3)
+
+
+def test_month_serial():
+    assert month_serial(2024, 1) - month_serial(2023, 12) == 1
+    for n in range(month_serial(1999, 1), month_serial(2030, 12)):
+        assert month_serial(*serial_month(n)) == n
+    assert serial_month(month_serial(2024, 12) + 1) == (2025, 1)
+    assert serial_quarter(quarter_serial(2024, 4) + 1) == (2025, 1)
+    assert quarter_serial(2024, 1) - quarter_serial(2023, 1) == 4
+
+
+def test_days_in_month():
+    for year in (1900, 2000, 2023, 2024):
+        for month in range(1, 13):
+            assert days_in_month(year, month) == calendar.monthrange(year, month)[1]
@@ -3,3 +3,33 @@ import ttcal
 
 def test_from_idtag():
     assert ttcal.from_idtag('m20124') == ttcal.Month(2012, 4)
+
+
+def test_navigation_cache():
+    ttcal.navigation_cache_clear()
+    days = ttcal.Days(ttcal.Day(2024, 1, 1), ttcal.Day(2024, 12, 31))
+    assert [d.Month.weeks for d in days]
+    info = ttcal.navigation_cache_info()
+    assert info['grid'].misses == 12
+    assert info['grid'].hits == 366 - 12
+
+
+def test_navigation_objects_are_fresh():
+    d = ttcal.Day(2024, 2, 29)
+    assert d.Month is not d.Month
+    assert d.Month == ttcal.Month(2024, 2)
+    assert d.Year == ttcal.Year(2024)
+    assert d.week == ttcal.Week.weeknum(9, 2024)
+    assert ttcal.Quarter(2024, 1).Year == d.Month.Year == d.Year
+
+    m = d.Month
+    m.mark(d, 'x')
+    assert list(m.marked_days()) == [d]
+    assert list(d.Month.marked_days()) == []
+    y = d.Year
+    y.mark_period(ttcal.Days(ttcal.Day(2024, 3, 1), ttcal.Day(2024, 3, 2)))
+    assert len(list(y.marked_days())) == 2
+    assert list(d.Year.marked_days()) == []
+    ttcal.Quarter(2024, 1).Year.mark(d)
+    d.week.days[0].mark = 'x'
+    assert not hasattr(d.week.days[0], 'mark')
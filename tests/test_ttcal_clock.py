@@ -0,0 +1,57 @@
+from datetime import date
+import ttcal
+from ttcal.clock import Clock, ClockMiddleware, current, today, today_ordinal
+from ttcal.templatetags.ttcal_tags import chop_at_now, is_current
+
+
+def test_no_scope():
+    assert current() is None
+    assert today() == date.today()
+    assert today_ordinal() == date.today().toordinal()
+
+
+def test_fixed_date():
+    with Clock(date(2024, 2, 29)) as clock:
+        assert current() is clock
+        assert today_ordinal() == date(2024, 2, 29).toordinal()
+        assert ttcal.Day() == ttcal.Day(2024, 2, 29)
+        assert ttcal.Today() == ttcal.Day(2024, 2, 29)
+        assert ttcal.Day(2024, 2, 29).today
+        assert not ttcal.Day(2024, 2, 28).today
+        assert 'today' in ttcal.Day(2024, 2, 29).display
+        assert repr(ttcal.Month()) == 'Month(2024, 2)'
+        assert repr(ttcal.Year()) == 'Year(2024)'
+        assert ttcal.Quarter().year == 2024
+        assert repr(ttcal.Week.weeknum()) == 'Week(9, month=2, year=2024)'
+        assert ttcal.Week.weeknum(9, 2024).current
+        assert not ttcal.Week.weeknum(10, 2024).current
+        assert len(list(ttcal.Week.weeknum(9, 2024).until_today())) == 3
+        assert is_current(ttcal.Month(2024, 2))
+        assert chop_at_now([ttcal.Year(2023), ttcal.Year(2024), ttcal.Year(2025)]) == [2023, 2024]
+    assert current() is None
+
+
+def test_nested():
+    with Clock(date(2024, 2, 29)) as outer:
+        with Clock(date(2000, 1, 1)):
+            assert ttcal.Day() == ttcal.Day(2000, 1, 1)
+        assert ttcal.Day() == ttcal.Day(2024, 2, 29)
+        with outer:
+            assert current() is outer
+        assert current() is outer
+
+
+def test_resolved_once():
+    clock = Clock()
+    with clock:
+        first = today()
+        assert today() is first
+        assert clock.ordinal == first.toordinal()
+
+
+def test_middleware():
+    seen = []
+    mw = ClockMiddleware(lambda request: seen.append(current()) or 'response')
+    assert mw('request') == 'response'
+    assert isinstance(seen[0], Clock)
+    assert current() is None
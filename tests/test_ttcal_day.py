@@ -1,6 +1,8 @@
 from datetime import date, datetime
 from unittest import TestCase
 import pickle
+import sys
+import threading
 import ttcal
 import pytest
 
@@ -29,6 +31,33 @@ def test_parse():
     assert ttcal.Day.parse('02.05.1970') == ttcal.Day(1970, 5, 2)
 
 
+def test_parse_fast_path():
+    assert ttcal.Day.parse('2012-04-06') == ttcal.Day(2012, 4, 6)
+    assert ttcal.Day.parse('06.04.2012') == ttcal.Day(2012, 4, 6)
+    assert ttcal.Day.parse('06042012') == ttcal.Day(2012, 4, 6)
+    # out-of-range values fall through to the regular expression
+    assert ttcal.Day.parse('2012-04-32') == ttcal.Day(2012, 4, 3)
+    assert ttcal.Day.parse('20130619') == ttcal.Day(2013, 6, 19)
+    with pytest.raises(ValueError):
+        ttcal.Day.parse('2012-04-31')
+    with pytest.raises(ValueError):
+        ttcal.Day.parse('00.04.2012')
+
+
+def test_parse_many():
+    rows = ['2012-04-06', '', '06.04.2012', 'foo', '2012-02-30']
+    with pytest.raises(ValueError):
+        list(ttcal.Day.parse_many(rows))
+    res = list(ttcal.Day.parse_many(rows, errors='none'))
+    assert res == [ttcal.Day(2012, 4, 6), None, ttcal.Day(2012, 4, 6), None, None]
+    res = list(ttcal.Day.parse_many(rows, errors='collect'))
+    assert res[:3] == [ttcal.Day(2012, 4, 6), None, ttcal.Day(2012, 4, 6)]
+    assert isinstance(res[3], ValueError)
+    assert isinstance(res[4], ValueError)
+    with pytest.raises(ValueError):
+        ttcal.Day.parse_many(rows, errors='ignore')
+
+
 def test_ctor_raises():
     with pytest.raises(TypeError):
         ttcal.Day(1,2,3,4,5)
@@ -306,3 +335,175 @@ class TestDays(TestCase):
                ttcal.Day(2012, 1, 7), ttcal.Day(2012, 1, 8),
                ttcal.Day(2012, 1, 9), ttcal.Day(2012, 1, 10)]
         assert self.days.range() == res
+
+
+def test_format_many():
+    days = [ttcal.Day(2012, 4, 10), ttcal.Day(2012, 12, 24)]
+    assert ttcal.format_many(days, 'd.m.Y') == ['10.04.2012', '24.12.2012']
+    assert ttcal.format_many(days, 'l j. F') == ['tirsdag 10. April', 'mandag 24. Desember']
+    assert ttcal.format_many(days) == [d.format() for d in days]
+    assert ttcal.format_many([], 'Y') == []
+
+
+def test_compile_format():
+    from ttcal.formatter import compile_format
+    assert compile_format('day', 'Y-m-d') is compile_format('day', 'Y-m-d')
+    assert compile_format('day', '{Y}')(ttcal.Day(2012, 4, 10)) == '{2012}'
+    assert compile_format('year', 'Y-m')(ttcal.Year(2012)) == '2012-m'
+
+
+@pytest.fixture
+def day_cache():
+    ttcal.Day.enable_cache(maxsize=100)
+    yield
+    ttcal.Day.disable_cache()
+
+
+def test_day_cache(day_cache):
+    a = ttcal.Day(2012, 4, 10)
+    assert ttcal.Day(2012, 4, 10) is a
+    assert ttcal.Day.fromordinal(a.toordinal()) is a
+    assert ttcal.Day(2012, 4, 9) + 1 is a
+    assert ttcal.Day(2012, 4, 10, membermonth=5) is not a
+    assert ttcal.Today() is not ttcal.Today()
+
+    info = ttcal.Day.cache_info()
+    assert info.hits == 3
+    assert info.currsize == 3
+
+    ttcal.Day.cache_clear()
+    assert ttcal.Day.cache_info() == (0, 0, 100, 0)
+    assert ttcal.Day(2012, 4, 10) is not a
+
+
+def test_day_cache_lru(day_cache):
+    first = ttcal.Day(2000, 1, 1)
+    for n in range(1, 150):
+        first + n
+    assert ttcal.Day.cache_info().currsize == 100
+    assert ttcal.Day(2000, 1, 1) is not first
+
+
+def test_day_cache_threads(day_cache):
+    errors = []
+
+    def work(offset):
+        try:
+            for n in range(2000):
+                ttcal.Day.fromordinal(730000 + (n * 7 + offset) % 300)
+        except Exception as e:  # pragma: nocover
+            errors.append(e)
+
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(0.005)
+    assert errors == []
+    info = ttcal.Day.cache_info()
+    assert info.hits + info.misses == 8 * 2000
+    assert info.currsize == 100
+
+
+def test_day_cache_mark(day_cache):
+    m1 = ttcal.Month(2012, 4)
+    m2 = ttcal.Month(2012, 4)
+    m1.mark(ttcal.Day(2012, 4, 10), 'foo')
+    assert m1[ttcal.Day(2012, 4, 10)].mark == 'foo'
+    assert not hasattr(m2[ttcal.Day(2012, 4, 10)], 'mark')
+    assert not hasattr(ttcal.Day(2012, 4, 10), 'mark')
+
+
+def test_day_cache_disabled():
+    assert ttcal.Day.cache_info() is None
+    assert ttcal.Day(2012, 4, 10) is not ttcal.Day(2012, 4, 10)
+
+
+def test_days_lazy():
+    days = ttcal.Days(ttcal.Day(2020, 1, 1), ttcal.Day(2029, 12, 31))
+    assert isinstance(days, list)
+    assert days.ordinals == range(days.first.toordinal(), days.last.toordinal() + 1)
+    assert len(days) == 3653
+    assert days[-1] == ttcal.Day(2029, 12, 31)
+    assert ttcal.Day(2024, 2, 29) in days
+    assert date(2030, 1, 1) not in days
+    assert 'foo' not in days
+    assert ttcal.Month(2024, 1) in days
+    assert ttcal.Week.weeknum(1, 2020) in days
+    assert ttcal.Month(2030, 1) not in days
+    assert next(reversed(days)) == days.last
+    assert days.index(ttcal.Day(2020, 1, 3)) == 2
+
+    jan = days[:31]
+    assert isinstance(jan, ttcal.Days)
+    assert jan.ordinals is not None
+    assert jan.last == ttcal.Day(2020, 1, 31)
+    assert jan.middle == ttcal.Day(2020, 1, 16)
+    assert jan == ttcal.Month(2020, 1).range()
+    assert jan[::10] == [ttcal.Day(2020, 1, 1), ttcal.Day(2020, 1, 11),
+                         ttcal.Day(2020, 1, 21), ttcal.Day(2020, 1, 31)]
+    assert pickle.loads(pickle.dumps(jan)) == jan
+
+
+def test_days_identity():
+    days = ttcal.Days(ttcal.Day(2020, 1, 1), ttcal.Day(2020, 1, 31))
+    assert days[0] is days[0]
+    assert days[:10][3] is days[3]
+    assert days.copy()[5] is days[5]
+    for d in days:
+        d.mark = 'x' if d.weekend else 'y'
+    assert [d.mark for d in days] == ['x' if d.weekend else 'y' for d in days]
+    assert [d.mark for d in reversed(days)][-1] == days.first.mark
+    first = days[0]
+    days.append(ttcal.Day(2020, 3, 1))
+    assert days[0] is first and days[0].mark == 'y'
+
+
+def test_days_modified():
+    days = ttcal.Days(ttcal.Day(2020, 1, 1), ttcal.Day(2020, 1, 3))
+    days.append(ttcal.Day(2020, 2, 1))
+    assert days.ordinals is None
+    assert len(days) == 4
+    assert days.last == ttcal.Day(2020, 2, 1)
+    days.sort(reverse=True)
+    assert days.first == ttcal.Day(2020, 2, 1)
+    assert pickle.loads(pickle.dumps(days)) == days
+
+
+def test_hash_contract():
+    d = ttcal.Day(2024, 3, 1)
+    assert hash(d) == hash(date(2024, 3, 1))
+    assert hash(d) == hash(ttcal.Day(2024, 3, 1, membermonth=2))
+    assert {date(2024, 3, 1): 'x'}[d] == 'x'
+    assert {d: 'x'}[date(2024, 3, 1)] == 'x'
+    assert len({d, date(2024, 3, 1), ttcal.Today(), date.today()}) == 2
+    assert not (d != date(2024, 3, 1))
+    assert d != datetime(2024, 3, 2)
+
+    for a, b in [(ttcal.Week.weeknum(9, 2024), d.week),
+                 (ttcal.Month(2024, 3), d.Month),
+                 (ttcal.Quarter(2024, 1), ttcal.Quarter(2024, 1)),
+                 (ttcal.Year(2024), d.Year)]:
+        assert a == b
+        assert hash(a) == hash(b)
+
+
+def test_grouping():
+    days = ttcal.Days(ttcal.Day(2015, 1, 1), ttcal.Day(2024, 12, 31))
+    dates = [d.toordinal() for d in days]
+    counts = {}
+    for d in days:
+        counts[d] = counts.get(d, 0) + 1
+    for n in dates:
+        dt = date.fromordinal(n)
+        counts[dt] = counts.get(dt, 0) + 1
+    by_month = {}
+    for d in counts:
+        by_month.setdefault(d.Month, []).append(d)
+    assert len(counts) == len(days)
+    assert set(counts.values()) == {2}
+    assert len(by_month) == 120
@@ -0,0 +1,78 @@
+from datetime import date
+import ttcal
+import pytest
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture
+def decade():
+    return ttcal.DayArray.range(ttcal.Day(2000, 1, 1), ttcal.Day(2009, 12, 31))
+
+
+def test_len(decade):
+    assert len(decade) == 3653
+    assert decade.first == ttcal.Day(2000, 1, 1)
+    assert decade.last == ttcal.Day(2009, 12, 31)
+
+
+def test_fields(decade):
+    days = decade.tolist()
+    assert decade.year.tolist() == [d.year for d in days]
+    assert decade.month.tolist() == [d.month for d in days]
+    assert decade.day.tolist() == [d.day for d in days]
+    assert decade.weekday.tolist() == [d.weekday for d in days]
+    assert decade.weeknum.tolist() == [d.weeknum for d in days]
+    assert decade.isoyear.tolist() == [d.isoyear for d in days]
+    assert decade.membermonth.tolist() == [d.membermonth for d in days]
+    assert decade.weekend.tolist() == [d.weekend for d in days]
+
+
+def test_membermonth():
+    m = ttcal.Month(2012, 4)
+    grid = ttcal.DayArray(m.dayiter())
+    assert grid.membermonth.tolist() == [d.membermonth for d in m.dayiter()]
+    assert grid[0].membermonth == 4
+    assert grid[0] == ttcal.Day(2012, 3, 26)
+    assert grid[grid.month == 4].membermonth.tolist() == [4] * 30
+
+
+def test_mask_and_slice(decade):
+    workdays = decade[decade.weekday < 5]
+    assert isinstance(workdays, ttcal.DayArray)
+    assert len(workdays) == 2609
+    assert not workdays.weekend.any()
+    assert decade[10:20].first == ttcal.Day(2000, 1, 11)
+    assert len(decade[::7]) == 522
+    assert decade[-1] == ttcal.Day(2009, 12, 31)
+    assert ttcal.Day(2005, 5, 5) in decade
+    assert date(2015, 5, 5) not in decade
+    assert (decade < ttcal.Day(2000, 1, 11)).sum() == 10
+    assert (decade == date(2000, 1, 1)).sum() == 1
+
+
+def test_conversions():
+    m = ttcal.Month(2012, 2)
+    a = ttcal.DayArray(m.range())
+    assert a.tolist() == list(m.range())
+    assert a.to_days() == m.range()
+    assert len(ttcal.DayArray.from_period(m)) == 29
+
+    y = ttcal.Year(2012)
+    a = ttcal.DayArray(y.days())
+    assert len(a) == 366
+    assert len(ttcal.DayArray(a)) == 366
+    assert a.tolist() == y.days()
+    assert (ttcal.DayArray.from_period(y) == a).all()
+
+    with pytest.raises(ValueError):
+        a[a.weekend].to_days()
+    with pytest.raises(ValueError):
+        ttcal.DayArray.range(ttcal.Day(2012, 1, 2), ttcal.Day(2012, 1, 1))
+
+
+def test_repr():
+    a = ttcal.DayArray.range(ttcal.Day(2012, 1, 1), ttcal.Day(2012, 1, 2))
+    assert repr(a) == 'DayArray([2012-01-01, 2012-01-02])'
+    a = ttcal.DayArray.from_period(ttcal.Month(2012, 1))
+    assert repr(a) == 'DayArray([2012-01-01, 2012-01-02, 2012-01-03, ..., 2012-01-29, 2012-01-30, 2012-01-31])'
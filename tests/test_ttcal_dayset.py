@@ -0,0 +1,65 @@
+import pickle
+import re
+from datetime import date
+import pytest
+import ttcal
+from ttcal import Day, Days, DaySet
+
+
+def test_construction():
+    march = DaySet(ttcal.Month(2024, 3))
+    assert len(march) == 31
+    assert march == DaySet(ttcal.Month(2024, 3).range())
+    assert march == DaySet(list(ttcal.Month(2024, 3).range()))
+    assert march == DaySet.from_span(*ttcal.Month(2024, 3).span)
+    assert len(DaySet(ttcal.Year(2024))) == 366
+    assert len(DaySet(ttcal.Week.weeknum(10, 2024))) == 7
+    assert len(DaySet(Day(2024, 3, 1))) == 1
+    assert len(DaySet(date(2024, 3, 1))) == 1
+    assert DaySet.from_ordinals([5, 3, 5]) == DaySet.from_ordinals([3, 5])
+    assert not DaySet()
+    assert DaySet().first is None
+
+    class Spanned(list):
+        def span(self):    # a method, like re.Match.span
+            return 0, 0
+
+    assert DaySet(Spanned([Day(2024, 3, 1), Day(2024, 3, 3)])) == DaySet([Day(2024, 3, 1), Day(2024, 3, 3)])
+    with pytest.raises(TypeError):
+        DaySet(re.match('a', 'a'))
+
+
+def test_algebra():
+    absent = DaySet(Days(Day(2024, 3, 1), Day(2024, 3, 20)))
+    open_days = DaySet(d for d in ttcal.Month(2024, 3).range() if not d.weekend)
+    assert len(open_days) == 21
+    assert len(absent & open_days) == 14
+    assert len(absent | open_days) == 27
+    assert len(absent - open_days) == 6
+    assert (absent ^ open_days) == (absent | open_days) - (absent & open_days)
+    assert absent.intersection(ttcal.Week.weeknum(10, 2024)) == DaySet(ttcal.Week.weeknum(10, 2024))
+    assert absent.union(Day(2024, 3, 30)).last == Day(2024, 3, 30)
+    assert absent.difference(ttcal.Month(2024, 3)) == DaySet()
+    assert absent.isdisjoint(ttcal.Month(2024, 4))
+    assert absent.issubset(ttcal.Month(2024, 3))
+    assert DaySet(ttcal.Year(2024)).issuperset(absent)
+    assert absent < DaySet(ttcal.Month(2024, 3))
+    assert not absent < absent
+    with pytest.raises(TypeError):
+        absent | [Day(2024, 3, 30)]
+
+
+def test_iteration():
+    days = [Day(2024, 2, 28), Day(2024, 2, 29), Day(2024, 3, 1), Day(2024, 3, 10)]
+    ds = DaySet(reversed(days))
+    assert list(ds) == days
+    assert Day(2024, 2, 29) in ds
+    assert Day(2024, 3, 2) not in ds
+    assert 'foo' not in ds
+    assert list(ds.ranges()) == [Days(days[0], days[2]), Days(days[3], days[3])]
+    assert repr(ds) == 'DaySet([2024-02-28..2024-03-01, 2024-03-10])'
+    with pytest.raises(ValueError):
+        ds.to_days()
+    assert DaySet(ttcal.Month(2024, 3)).to_days() == ttcal.Month(2024, 3).range()
+    assert pickle.loads(pickle.dumps(ds)) == ds
+    assert hash(ds) == hash(DaySet(days))
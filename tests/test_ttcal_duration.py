@@ -25,10 +25,59 @@ def toint_obj():
 def test_sum(dd):
     assert ttcal.Duration.sum(dd) == ttcal.Duration(days=1, hours=6, minutes=44, seconds=20)
     assert ttcal.Duration.sum(dd, ttcal.Duration(days=1)) == ttcal.Duration(days=2, hours=6, minutes=44, seconds=20)
+    res = ttcal.Duration.sum(iter(dd))
+    assert type(res) is ttcal.Duration
+    assert res == ttcal.Duration(days=1, hours=6, minutes=44, seconds=20)
+    assert ttcal.Duration.sum([]) == ttcal.Duration(0)
+    assert ttcal.Duration.sum([ttcal.Duration(hours=-2), ttcal.Duration(minutes=30)]) == ttcal.Duration(minutes=-90)
+    # sub-second parts are dropped from each item, like repeated addition
+    items = [timedelta(seconds=1, microseconds=600000)] * 3
+    res = ttcal.Duration(0)
+    for item in items:
+        res += item
+    assert ttcal.Duration.sum(items) == res == ttcal.Duration(seconds=3)
+
+
+def test_sum_by(dd):
+    res = ttcal.Duration.sum_by(lambda d: d.days, dd)
+    assert list(res) == [1, 0]
+    assert res[1] == dd[0]
+    assert res[0] == ttcal.Duration(hours=3, minutes=30)
+    assert all(type(v) is ttcal.Duration for v in res.values())
+
+    rows = [('ola', dd[0]), ('kari', dd[1]), ('ola', dd[2])]
+    res = ttcal.Duration.sum_by(lambda r: r[0], rows, value=lambda r: r[1])
+    assert res == {'ola': dd[0] + dd[2], 'kari': dd[1]}
+    assert ttcal.Duration.sum_by(len, []) == {}
 
 
 def test_duration_tuple(dd):
     assert dd[0].duration_tuple() == ('', 27, 14, 20)
+    assert dd[0].duration_tuple() is dd[0].duration_tuple()
+    assert ttcal.Duration(-dd[0]).duration_tuple() == ('-', 27, 14, 20)
+    assert ttcal.Duration().duration_tuple() == ('', 0, 0, 0)
+
+
+def test_decompose_many(dd):
+    assert ttcal.Duration.decompose_many(dd + [None, -dd[0]]) == [
+        d.duration_tuple() for d in dd] + [None, ('-', 27, 14, 20)]
+    assert ttcal.Duration.decompose_many(iter([timedelta(seconds=61)])) == [('', 0, 1, 1)]
+
+
+def test_decomposed_once(monkeypatch):
+    import ttcal.duration
+    calls = []
+    decompose = ttcal.duration._decompose
+    monkeypatch.setattr(ttcal.duration, '_decompose', lambda secs: calls.append(secs) or decompose(secs))
+
+    rows = [ttcal.Duration(seconds=n * 37) for n in range(100)]
+    cells = [f'{d.hrs}|{d.hours}|{d.mins:02d}|{d.secs:02d}|{d}|{d!r}' for d in rows]
+    assert len(calls) == len(rows)
+    assert cells[-1] == '1|1|01|03|1:01:03|Duration(hours=1, minutes=1, seconds=3)'
+
+    bulk = [f'{h}|{h % 24}|{m:02d}|{sc:02d}|{sign}{h}:{m:02d}:{sc:02d}'
+            for sign, h, m, sc in ttcal.Duration.decompose_many(rows)]
+    assert bulk == [c.rsplit('|', 1)[0] for c in cells]
 
 
 def test_str(dd):
@@ -125,6 +174,27 @@ def test_parse(dd):
     assert dd[1].parse('01:10:00') == dd[2]
     assert ttcal.Duration.parse("") is None
     assert ttcal.Duration.parse("-1:10") == ttcal.Duration(hours=-1, minutes=-10)
+    assert ttcal.Duration.parse("7:30:15") == ttcal.Duration(hours=7, minutes=30, seconds=15)
+    assert ttcal.Duration.parse("1 d 2:15") == ttcal.Duration(days=1, hours=2, minutes=15)
+    assert ttcal.Duration.parse("-2 weeks, 1 day") == ttcal.Duration(days=-15)
+    assert ttcal.Duration.parse("7:30 pm") == ttcal.Duration(hours=7, minutes=30)
+    with pytest.raises(ValueError):
+        ttcal.Duration.parse("7:30 pm", raise_on_error=True)
+
+
+def test_parse_many():
+    rows = ['7:30', '', '1 d 2:15', '7:30 pm', '-0:45']
+    res = list(ttcal.Duration.parse_many(rows, errors='collect'))
+    assert res[0] == ttcal.Duration(hours=7, minutes=30)
+    assert res[1] is None
+    assert res[2] == ttcal.Duration(days=1, hours=2, minutes=15)
+    assert isinstance(res[3], ValueError)
+    assert res[4] == ttcal.Duration(minutes=-45)
+    assert list(ttcal.Duration.parse_many(rows, errors='none'))[3] is None
+    with pytest.raises(ValueError):
+        list(ttcal.Duration.parse_many(rows))
+    with pytest.raises(ValueError):
+        ttcal.Duration.parse_many(rows, errors='ignore')
 
 
 def test_add(dd):
@@ -138,6 +208,10 @@ def test_sub(dd):
 
 def test_mul(dd):
     assert dd[2] * 3 == ttcal.Duration(hours=3, minutes=30)
+    assert type(dd[2] * 3) is ttcal.Duration
+    assert dd[2] * 1.5 == ttcal.Duration(hours=1, minutes=45)
+    assert type(dd[0] + dd[1]) is type(dd[0] - dd[1]) is ttcal.Duration
+    assert (dd[0] + timedelta(microseconds=999999)) == dd[0]
 
 
 def test_div(dd):
@@ -0,0 +1,79 @@
+from datetime import timedelta
+import ttcal
+from ttcal import Duration, DurationArray
+import pytest
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture
+def hours():
+    return DurationArray.parse(['7:30', '8:00', '', '9:15', '-0:45'])
+
+
+def test_roundtrip(hours):
+    assert len(hours) == 5
+    assert hours.seconds.dtype == np.int64
+    assert hours.tolist() == [Duration(hours=7, minutes=30), Duration(hours=8), Duration(0),
+                              Duration(hours=9, minutes=15), Duration(minutes=-45)]
+    assert all(type(d) is Duration for d in hours)
+    assert DurationArray(hours.tolist()).seconds.tolist() == hours.seconds.tolist()
+    assert DurationArray(hours).seconds is hours.seconds
+    assert hours[3] == Duration(hours=9, minutes=15)
+    assert hours[-1] == Duration(minutes=-45)
+    assert DurationArray([timedelta(days=1, microseconds=5), None])[0] == Duration(days=1)
+    assert len(DurationArray()) == 0
+
+
+def test_parse():
+    col = ['1:00', 'x', '2 days, 0:30']
+    with pytest.raises(ValueError):
+        DurationArray.parse(col)
+    assert DurationArray.parse(col, errors='none').tolist() == [
+        Duration(hours=1), Duration(0), Duration(days=2, minutes=30)]
+    with pytest.raises(ValueError):
+        DurationArray.parse(col, errors='collect')
+
+
+def test_aggregations(hours):
+    assert hours.sum() == Duration.sum(hours) == Duration(hours=24)
+    assert hours.mean() == Duration(hours=4, minutes=48)
+    assert hours.min() == Duration(minutes=-45)
+    assert hours.max() == Duration(hours=9, minutes=15)
+    assert hours.percentile(50) == Duration(hours=7, minutes=30)
+    assert hours.percentile([0, 100]).tolist() == [hours.min(), hours.max()]
+    assert DurationArray().sum() == Duration(0)
+    with pytest.raises(ValueError):
+        DurationArray().mean()
+
+
+def test_compare_and_mask(hours):
+    assert (hours > Duration(hours=8)).tolist() == [False, False, False, True, False]
+    assert (hours == timedelta(hours=8)).tolist() == [False, True, False, False, False]
+    assert (hours <= hours).all()
+    long_days = hours[hours >= Duration(hours=8)]
+    assert isinstance(long_days, DurationArray)
+    assert long_days.sum() == Duration(hours=17, minutes=15)
+    assert hours[1:3].tolist() == [Duration(hours=8), Duration(0)]
+    assert (hours == 5) is False
+
+
+def test_sum_by():
+    days = ttcal.DayArray.range(ttcal.Day(2024, 3, 1), ttcal.Day(2024, 3, 14))
+    hours = DurationArray([Duration(hours=0 if d.weekend else 7, minutes=30) for d in days])
+    res = hours.sum_by(days.weeknum)
+    expected = {}
+    for d, h in zip(days, hours):
+        expected[d.weeknum] = expected.get(d.weeknum, Duration(0)) + h
+    assert res == expected
+    assert list(res) == [9, 10, 11]
+    with pytest.raises(ValueError):
+        hours.sum_by([1, 2])
+
+
+def test_strings(hours):
+    assert hours.strings() == [str(d) for d in hours] == [
+        '7:30:00', '8:00:00', '0:00:00', '9:15:00', '-0:45:00']
+    assert repr(hours[:2]) == 'DurationArray([7:30:00, 8:00:00])'
+    assert repr(DurationArray([Duration(hours=100)] * 8)) == (
+        'DurationArray([100:00:00, 100:00:00, 100:00:00, ..., 100:00:00, 100:00:00, 100:00:00])')
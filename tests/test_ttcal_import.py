@@ -4,8 +4,14 @@ Test that all modules are importable.
 
 import ttcal
 import ttcal.calfns
+import ttcal.clock
 import ttcal.day
+import ttcal.dayarray
+import ttcal.dayset
 import ttcal.duration
+import ttcal.durationarray
+import ttcal.formatter
+import ttcal.marks
 import ttcal.month
 import ttcal.templatetags
 import ttcal.templatetags.ttcal_tags
@@ -19,8 +25,14 @@ def test_import_ttcal():
     
     assert ttcal
     assert ttcal.calfns
+    assert ttcal.clock
     assert ttcal.day
+    assert ttcal.dayarray
+    assert ttcal.dayset
     assert ttcal.duration
+    assert ttcal.durationarray
+    assert ttcal.formatter
+    assert ttcal.marks
     assert ttcal.month
     assert ttcal.templatetags
     assert ttcal.templatetags.ttcal_tags
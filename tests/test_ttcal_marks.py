@@ -0,0 +1,123 @@
+import pytest
+import ttcal
+from ttcal.marks import MarkStore
+
+
+def test_mark_store():
+    marks = MarkStore()
+    marks.mark(10, 20, 'a')
+    marks.mark(20, 25, 'a')      # coalesced with [10, 20)
+    assert list(marks.intervals()) == [(10, 25, 'a')]
+    marks.mark(15, 17, 'b')      # splits [10, 25)
+    assert list(marks.intervals()) == [(10, 15, 'a'), (15, 17, 'b'), (17, 25, 'a')]
+    marks.mark(15, 17, 'a')
+    assert len(marks) == 1
+    assert marks.get(9) is None
+    assert marks.get(10) == 'a'
+    assert marks.get(25, 'x') == 'x'
+    assert list(marks.intervals(20, 30)) == [(20, 25, 'a')]
+    assert list(marks.intervals(0, 10)) == []
+
+
+def test_mark_store_append():
+    marks = MarkStore()
+    marks.mark(10, 12, 'a')
+    marks.mark(11, 14, 'b', method='append')
+    assert list(marks.intervals()) == [(10, 11, 'a'), (11, 12, 'ab'), (12, 14, 'b')]
+    with pytest.raises(ValueError):
+        marks.mark(1, 2, 'c', method='prepend')
+    v = marks.version
+    marks.clear()
+    assert len(marks) == 0
+    assert marks.version > v
+
+
+def test_long_period_is_one_interval():
+    y = ttcal.Year(2024)
+    leave = ttcal.Days(ttcal.Day(2023, 6, 1), ttcal.Day(2026, 5, 31))
+    y.mark_period(leave, 'permisjon')
+    assert len(y.marks) == 1
+    assert len(list(y.marked_days())) == 366
+    assert 'permisjon' in y[ttcal.Day(2024, 2, 29)].display
+
+
+def test_shared_between_views():
+    marks = MarkStore()
+    y = ttcal.Year(2024, marks=marks)
+    q = ttcal.Quarter(2024, 3, marks=marks)
+    m = ttcal.Month(2024, 7, marks=marks)
+    assert m[ttcal.Day(2024, 7, 1)]   # the calendars are built before marking
+
+    y.mark_period(ttcal.Days(ttcal.Day(2024, 7, 1), ttcal.Day(2024, 7, 21)), 'ferie')
+    q.mark(ttcal.Day(2024, 7, 22), 'syk')
+    assert m[ttcal.Day(2024, 7, 21)].mark == 'ferie'
+    assert m[ttcal.Day(2024, 7, 22)].mark == 'syk'
+    assert y.july[ttcal.Day(2024, 7, 22)].mark == 'syk'
+    assert [d.day for d in q.marked_days()] == list(range(1, 23))
+    assert list(m.marked_days()) == list(y.marked_days())
+
+    # the leading days in the August calendar show the marks too
+    m.mark(ttcal.Day(2024, 7, 31), 'kurs')
+    assert y.august[ttcal.Day(2024, 7, 31)].mark == 'kurs'
+    assert list(y.august.marked_days()) == [ttcal.Day(2024, 7, 31)]
+    assert [d for d in y.august.marked_days() if 'kurs' in d.display] == [ttcal.Day(2024, 7, 31)]
+
+
+def test_clear_and_overwrite_remove_marks():
+    y = ttcal.Year(2024)
+    d = ttcal.Day(2024, 5, 17)
+    y.mark_period(ttcal.Days(ttcal.Day(2024, 5, 16), ttcal.Day(2024, 5, 18)), 'fri')
+    assert 'fri' in y[d].display
+    y.marks.clear()
+    assert 'fri' not in y[d].display
+    assert not hasattr(y[d], 'mark')
+    assert list(y.marked_days()) == []
+
+    m = ttcal.Month(2024, 5)
+    m.mark_period(ttcal.Days(ttcal.Day(2024, 5, 16), ttcal.Day(2024, 5, 18)), 'fri')
+    assert m[d].mark == 'fri'
+    m.marks.mark(d.toordinal(), d.toordinal() + 1, 'syk')
+    m.marks.mark(ttcal.Day(2024, 5, 16).toordinal(), d.toordinal(), 'syk')
+    assert [(x.day, x.mark) for x in m.marked_days()] == [(16, 'syk'), (17, 'syk'), (18, 'fri')]
+    m.marks.clear()
+    assert 'fri' not in m[ttcal.Day(2024, 5, 18)].display
+
+
+def test_direct_marks_are_kept():
+    m = ttcal.Month(2024, 5)
+    d = m[ttcal.Day(2024, 5, 2)]
+    d.mark = 'foo'                      # assigned directly, as templates do
+    m.mark(ttcal.Day(2024, 5, 3), 'bar')
+    assert [(x.day, x.mark) for x in m.marked_days()] == [(2, 'foo'), (3, 'bar')]
+    m.marks.clear()
+    assert d.mark == 'foo'
+    assert not hasattr(m[ttcal.Day(2024, 5, 3)], 'mark')
+    assert list(m.marked_days()) == [d]
+
+    m.mark(d, 'bar', method='append')
+    assert d.mark == 'foobar'
+
+    y = ttcal.Year(2024)
+    y[ttcal.Day(2024, 2, 29)].mark = 'skudd'
+    y.mark(ttcal.Day(2024, 3, 1), 'x')
+    assert [(x.day, x.mark) for x in y.marked_days()] == [(29, 'skudd'), (1, 'x')]
+    q = ttcal.Quarter(2024, 1)
+    q[ttcal.Day(2024, 1, 5)].mark = 'q'
+    assert [x.mark for x in q.marked_days()] == ['q']
+
+
+def test_mark_outside_is_ignored():
+    m = ttcal.Month(2024, 5)
+    m.mark(ttcal.Day(2024, 8, 1), 'x')
+    m.mark(ttcal.Day(2024, 5, 1), 'x', method='prepend')   # unknown methods are ignored
+    assert len(m.marks) == 0
+    m.mark_period(ttcal.Days(ttcal.Day(2024, 1, 1), ttcal.Day(2024, 12, 31)), 'x')
+    assert list(m.marks.intervals()) == [(m.grid.start, m.grid.end, 'x')]
+
+    y = ttcal.Year(2024)
+    y.mark(ttcal.Day(2025, 1, 1), 'x')
+    assert len(y.marks) == 0
+    q = ttcal.Quarter(2024, 2)
+    q.mark(ttcal.Day(2024, 7, 1), 'x')
+    q.mark_period(ttcal.Days(ttcal.Day(2024, 6, 30), ttcal.Day(2024, 7, 2)), 'y')
+    assert list(q.marks.intervals()) == [(q.span[1] - 1, q.span[1], 'y')]
@@ -0,0 +1,35 @@
+"""
+Tests of the memory layout of the ttcal period objects (cf.
+``benchmarks/bench.py memory`` for the bytes per object).
+"""
+import ttcal
+import pytest
+
+
+@pytest.mark.parametrize('cls', [ttcal.Day, ttcal.Today, ttcal.Week, ttcal.Month, ttcal.Quarter, ttcal.Year])
+def test_slots(cls):
+    assert '__slots__' in vars(cls)
+
+
+@pytest.mark.parametrize('obj', [
+    ttcal.Day(2012, 4, 10),
+    ttcal.Today(),
+    ttcal.Week.weeknum(15, 2012),
+    ttcal.Month(2012, 4),
+    ttcal.Quarter(2012, 2),
+    ttcal.Year(2012),
+])
+def test_no_instance_dict(obj):
+    assert not hasattr(obj, '__dict__')
+
+
+def test_template_attributes():
+    m = ttcal.Month(2012, 4)
+    d = m.weeks[0].days[0]
+    assert d.membermonth == 4
+    assert not hasattr(d, 'mark')
+    d.mark = 'foo'
+    assert d.mark == 'foo'
+    assert m.name == 'April'
+    assert m.short_name == 'Apr'
+    assert len(m.weeks) == 6
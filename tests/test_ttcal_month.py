@@ -255,3 +255,43 @@ def test_mark(months):
 
     # with pytest.raises(KeyError):
     #     m.mark(ttcal.Day(2000, 1, 1), 'foobarbaz')
+
+
+def test_lazy_weeks():
+    m = ttcal.Month(2012, 4)
+    n = m + 1
+    assert m.first == ttcal.Day(2012, 4, 1)
+    assert len(m) == 30
+    assert m.idtag() == 'm20124'
+    assert m._cached_weeks is None
+    assert n._cached_weeks is None
+
+    weeks = m.weeks
+    assert m.weeks is weeks
+    assert len(weeks) == 6
+    assert len(m.days()) == 30
+    assert len(list(m.dayiter())) == 42
+
+
+def test_shared_grid():
+    a = ttcal.Month(2024, 3)
+    b = ttcal.Month(2024, 3)
+    assert a.grid is b.grid
+    assert a.grid.start == ttcal.Day(2024, 2, 26).toordinal()
+    assert [wk.num for wk in a.weeks] == [9, 10, 11, 12, 13]
+    assert [wk.days for wk in a.weeks] == [wk.days for wk in b.weeks]
+
+    # marks are per Month object, the grid is never touched
+    a.mark(ttcal.Day(2024, 3, 5), 'x')
+    assert a[ttcal.Day(2024, 3, 5)].mark == 'x'
+    assert not hasattr(b[ttcal.Day(2024, 3, 5)], 'mark')
+    assert not hasattr(ttcal.Month(2024, 3)[ttcal.Day(2024, 3, 5)], 'mark')
+
+
+def test_serial():
+    m = ttcal.Month(2024, 3)
+    assert ttcal.Month.from_serial(m.serial) == m
+    assert ttcal.Month.from_serial(m.serial + 10) == ttcal.Month(2025, 1)
+    assert ttcal.Month(2025, 1) - m == 10
+    assert m - ttcal.Month(2025, 1) == -10
+    assert [ttcal.Month.from_serial(n) for n in range(m.serial, m.serial + 240)][-1] == ttcal.Month(2044, 2)
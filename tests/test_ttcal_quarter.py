@@ -48,6 +48,8 @@ def test_quarter(quarters):
 
 def test_hash(quarters):
     assert hash(quarters[0]) == hash(ttcal.Quarter(2005, 1))
+    assert len({hash(ttcal.Quarter(y, 1)) for y in range(2000, 2010)}) == 10
+    assert len({hash(ttcal.Quarter(2005, q)) for q in range(1, 5)}) == 4
 
 
 def test_from_idtag(quarters):
@@ -91,3 +93,32 @@ def test_format(quarters):
     assert quarters[0].format('q') == '1'
     assert quarters[0].format('Q') == '2005Q1'
     assert quarters[0].format() == '2005Q1'
+
+
+def test_lazy_months():
+    q = ttcal.Quarter(2012, 1)
+    assert q._cached_months is None
+    assert q.first == ttcal.Day(2012, 1, 1)
+    assert q.last == ttcal.Day(2012, 3, 31)
+    assert q.daycount == 91
+    assert q._cached_months is None
+    assert [m.month for m in q.months] == [1, 2, 3]
+
+
+def test_add_wraps():
+    assert ttcal.Quarter(2005, 4) + 1 == ttcal.Quarter(2006, 1)
+    assert ttcal.Quarter(2005, 1) - 1 == ttcal.Quarter(2004, 4)
+    assert ttcal.Quarter(2005, 2) + 7 == ttcal.Quarter(2007, 1)
+
+
+def test_invalid_quarter():
+    with pytest.raises(ValueError):
+        ttcal.Quarter(2005, 5)
+
+
+def test_serial():
+    q = ttcal.Quarter(2024, 3)
+    assert ttcal.Quarter.from_serial(q.serial) == q
+    assert ttcal.Quarter(2025, 2) - q == 3
+    assert ttcal.Year(2025) - ttcal.Year(2020) == 5
+    assert ttcal.Year.from_serial(ttcal.Year(2020).serial) == ttcal.Year(2020)
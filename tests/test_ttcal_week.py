@@ -113,6 +113,22 @@ def test_from_idtag(week):
     assert ttcal.Week.from_idtag('w20124') == week[0]
 
 
+def test_weeknum_normalized():
+    # 2016 has 52 weeks, so week 53 is week 1 of 2017
+    w = ttcal.Week.weeknum(53, 2016)
+    assert (w.year, w.num) == (2017, 1)
+    assert w.idtag() == 'w20171'
+    assert w == ttcal.Week.weeknum(1, 2017)
+    assert hash(w) == hash(ttcal.Week.weeknum(1, 2017))
+    assert ttcal.Week.from_idtag('w201653').idtag() == 'w20171'
+
+    # week 0 is the last week of the previous year
+    w = ttcal.Week.weeknum(0, 2016)
+    assert (w.year, w.num) == (2015, 53)
+    assert w.first == ttcal.Day(2015, 12, 28)
+    assert ttcal.Week.weeknum(53, 2015).idtag() == 'w201553'
+
+
 # @pytest.fixture
 # def weeks():
 #     return ttcal.Weeks(1, 10)  # 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 (n=11)
@@ -129,3 +145,74 @@ def test_from_idtag(week):
 #
 # def test_datetuple(weeks):
 #     assert weeks.datetuple() == ttcal.Year().first.datetuple()
+
+
+def test_from_ordinal():
+    d = Day(2021, 1, 3)
+    w = ttcal.Week.from_ordinal(d.toordinal())
+    assert (w.year, w.num) == (2020, 53)
+    assert w == ttcal.Week.weeknum(53, 2020)
+    assert w == d.week
+    assert w._days is None
+    assert w.first == Day(2020, 12, 28)
+    assert w.last == d
+    assert w.rangetuple()[0].date() == w.first
+    assert d in w
+    assert Day(2021, 1, 4) not in w
+    assert ttcal.Month(2021, 1) in w
+    assert None not in w
+    assert w._days is None
+    assert len(w.days) == 7
+    assert w.first is w.days[0]
+    assert ttcal.Week.from_ordinal(d.toordinal(), month=1).first.membermonth == 1
+
+
+def test_arithmetic():
+    w = ttcal.Week.weeknum(52, 2020)
+    assert w + 1 == ttcal.Week.weeknum(53, 2020)
+    assert (w + 2).year == 2021
+    assert (w + 2).num == 1
+    assert 2 + w == w.next().next()
+    assert (w + 2).prev() == w + 1
+    assert w - 52 == ttcal.Week.weeknum(52, 2019)
+    assert ttcal.Week.weeknum(1, 2022) - w == 54
+    assert w - ttcal.Week.weeknum(1, 2022) == -54
+
+
+def test_weeks():
+    weeks = ttcal.Weeks(ttcal.Week.weeknum(1, 2020), ttcal.Week.weeknum(53, 2020))
+    assert len(weeks) == 53
+    assert weeks[-1].num == 53
+    assert [w.num for w in weeks[:3]] == [1, 2, 3]
+    assert isinstance(weeks[10:20], ttcal.Weeks)
+    assert len(weeks[10:20]) == 10
+    assert weeks[10:20].first == ttcal.Week.weeknum(11, 2020)
+    assert ttcal.Week.weeknum(10, 2020) in weeks
+    assert Day(2021, 1, 3) in weeks
+    assert Day(2021, 1, 4) not in weeks
+    assert weeks.index(ttcal.Week.weeknum(3, 2020)) == 2
+    assert weeks.index(Day(2020, 1, 15), 2) == 2
+    assert weeks.count(ttcal.Week.weeknum(3, 2020)) == weeks.count(Day(2020, 1, 15)) == 1
+    assert weeks.count(ttcal.Week.weeknum(3, 2021)) == weeks.count('foo') == 0
+    with pytest.raises(ValueError):
+        weeks.index(ttcal.Week.weeknum(3, 2020), 3)
+    with pytest.raises(ValueError):
+        weeks.index('foo')
+    assert len(list(weeks.dayiter())) == 53 * 7
+    assert weeks.range() == ttcal.Days(Day(2019, 12, 30), Day(2021, 1, 3))
+    a, b = weeks.between_tuple()
+    assert b - a == timedelta(days=53 * 7 - 1, hours=23, minutes=59, seconds=59)
+    assert ttcal.Weeks(Day(2019, 12, 31), Day(2021, 1, 1)) == weeks
+    assert str(weeks[:2]) == '[Uke 1 (2020), Uke 2 (2020)]'
+    with pytest.raises(ValueError):
+        ttcal.Weeks(Day(2021, 1, 1), Day(2020, 1, 1))
+
+
+def test_weeks_index_is_lazy(monkeypatch):
+    weeks = ttcal.Weeks(Day(2000, 1, 3), Day(2099, 12, 31))
+    created = []
+    from_start = ttcal.Week._from_start
+    monkeypatch.setattr(ttcal.Week, '_from_start', lambda *a, **kw: created.append(1) or from_start(*a, **kw))
+    assert weeks.index(Day(2099, 12, 30)) == len(weeks) - 1
+    assert weeks.count(Day(2050, 6, 1)) == 1
+    assert created == []
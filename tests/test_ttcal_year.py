@@ -179,3 +179,34 @@ def test_int_years():
     assert ttcal.Year(2016) >= 2015
     assert ttcal.Year(2016) != 2015
     assert ttcal.Year(2016) == 2016
+
+
+def test_lazy_months():
+    y = ttcal.Year(2012)
+    assert y._cached_months is None
+    assert y.first == ttcal.Day(2012, 1, 1)
+    assert y.last == ttcal.Day(2012, 12, 31)
+    assert y.daycount == 366
+    assert y._cached_months is None
+    assert len(y.months) == 12
+
+
+def test_many_marks(monkeypatch):
+    """Marking and lookup go straight to the day (no scanning/comparing
+       of the days in the month).
+    """
+    compares = []
+    compare = ttcal.Day.compare
+    monkeypatch.setattr(ttcal.Day, 'compare', lambda a, b: compares.append(1) or compare(a, b))
+
+    y = ttcal.Year(2024)
+    first = y.first.toordinal()
+    for i in range(5000):
+        y.mark(ttcal.Day.fromordinal(first + i % 366), str(i % 10))
+    y.mark_period(ttcal.Days(ttcal.Day(2024, 3, 1), ttcal.Day(2024, 5, 31)), 'absent')
+
+    assert not compares
+    assert y[ttcal.Day(2024, 1, 1)].mark == '8'
+    assert y[ttcal.Day(2024, 3, 1)].mark == 'absent'
+    assert y[ttcal.Day(2024, 6, 1)].mark != 'absent'
+    assert len(list(y.marked_days())) == 366
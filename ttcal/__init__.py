@@ -4,11 +4,31 @@ Date classes (originally from TikTok).
 __version__ = '2.0.9'
 from .day import Day, Days, Today   # noqa  
 from .duration import Duration, Period  # noqa
-from .calfns import chop, isoweek   # noqa
+from .calfns import chop, isoweek, month_grid   # noqa
 from .month import Month
-from .week import Week
+from .week import Week, Weeks  # noqa
 from .year import Year
 from .quarter import Quarter
+from .dayarray import DayArray  # noqa
+from .dayset import DaySet  # noqa
+from .durationarray import DurationArray  # noqa
+from .formatter import format_many  # noqa
+
+
+def navigation_cache_info():
+    """Return the cache statistics (hits, misses, maxsize, currsize) of
+       the month grids shared by the Month objects returned by e.g.
+       ``day.Month``.
+    """
+    return {
+        'grid': month_grid.cache_info(),
+    }
+
+
+def navigation_cache_clear():
+    """Empty the cache of shared month grids (cf. `navigation_cache_info`).
+    """
+    month_grid.cache_clear()
 
 
 def from_idtag(idtag):
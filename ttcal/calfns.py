@@ -2,8 +2,9 @@
 Misc. calendar functions.
 """
 from __future__ import annotations
-from typing import Iterator, List, Tuple, Union, Any
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union, Any
 import datetime
+from functools import lru_cache
 from itertools import islice
 
 
@@ -24,6 +25,91 @@ def chop(it: Iterator, n: int) -> Iterator[List]:
         yield s
 
 
+@lru_cache(maxsize=None)
+def _isoyear_bounds(year: int) -> Tuple[int, int]:
+    """Return the ordinals of the first day (Monday) of ISO week 1 in `year`
+       and in the following year.
+
+       The values are computed (and cached) lazily, one year at a time.
+    """
+    # 4th of January is always in week 1
+    jan4 = datetime.date(year, 1, 4).toordinal()
+    next_jan4 = jan4 + 365 + (1 if _isleap(year) else 0)
+    # ordinal 1 (Jan 1st of year 1) is a Monday.
+    return jan4 - (jan4 - 1) % 7, next_jan4 - (next_jan4 - 1) % 7
+
+
+def _isleap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def days_in_month(year: int, month: int) -> int:
+    """Return the number of days in `month` of `year`.
+    """
+    if month == 2 and _isleap(year):
+        return 29
+    return _MONTH_DAYS[month]
+
+
+def month_serial(year: int, month: int) -> int:
+    """Return the number of months from January of year 0 to `month` of
+       `year`, i.e. consecutive months have consecutive serials.
+    """
+    return year * 12 + month - 1
+
+
+def serial_month(serial: int) -> Tuple[int, int]:
+    """Return the (year, month) with the given month serial.
+    """
+    year, m = divmod(serial, 12)
+    return year, m + 1
+
+
+def quarter_serial(year: int, quarter: int) -> int:
+    """Return the number of quarters from the first quarter of year 0 to
+       `quarter` of `year`.
+    """
+    return year * 4 + quarter - 1
+
+
+def serial_quarter(serial: int) -> Tuple[int, int]:
+    """Return the (year, quarter) with the given quarter serial.
+    """
+    year, q = divmod(serial, 4)
+    return year, q + 1
+
+
+def isoweek_start(year: int, week: int) -> int:
+    """Return the ordinal of the first day (Monday) of ISO week `week`
+       in ISO year `year`.
+    """
+    return _isoyear_bounds(year)[0] + (week - 1) * 7
+
+
+def isocalendar(ordinal: int, year: Optional[int] = None) -> Tuple[int, int, int]:
+    """Return the ISO (year, week, weekday) of the day with the given ordinal,
+       like `datetime.date.isocalendar()`, but without creating any objects.
+
+       Args:
+           ordinal: The (proleptic Gregorian) ordinal of the day.
+           year: The (Gregorian) year of the day, if known.
+    """
+    if year is None:
+        year = datetime.date.fromordinal(ordinal).year
+    start, end = _isoyear_bounds(year)
+    if ordinal < start:
+        year -= 1
+        start = _isoyear_bounds(year)[0]
+    elif ordinal >= end:
+        year += 1
+        start = end
+    n = ordinal - start
+    return year, n // 7 + 1, n % 7 + 1
+
+
 def isoweek(year: int, week: int) -> Iterator[datetime.date]:
     """Iterate over the days in ISO week `week` of `year`.
 
@@ -34,22 +120,41 @@ def isoweek(year: int, week: int) -> Iterator[datetime.date]:
        Yields:
            datetime.date objects for each day in the week.
     """
-    # 4th of January is always in week 1
-    wk1date = datetime.date(year, 1, 4)
+    start = isoweek_start(year, week)
+    for n in range(start, start + 7):
+        yield datetime.date.fromordinal(n)
+
 
-    # daynumber of the 4th, zero-based
-    weekday = wk1date.weekday()
+class MonthGrid(NamedTuple):
+    """The (immutable) shape of a month calendar.
 
-    # (proleptic Gregorian) ordinal of first day of week 1
-    day1 = wk1date.toordinal() - weekday
+       Attributes:
+           start: Ordinal of the first day in the grid.
+           end: Ordinal of the day after the last day in the grid.
+           weeks: The (isoyear, weeknum) of each week (row) in the grid.
+    """
+    start: int
+    end: int
+    weeks: Tuple[Tuple[int, int], ...]
 
-    # first day in week
-    start = day1 + (week-1) * 7
-    # one past last day in week
-    stop = day1 + week*7
 
-    for n in range(start, stop):
-        yield datetime.date.fromordinal(n)
+@lru_cache(maxsize=1200)
+def month_grid(year: int, month: int, firstweekday: int = 0) -> MonthGrid:
+    """Return the grid of the month calendar for `month` in `year`, i.e.
+       whole weeks starting on `firstweekday` (0 is Monday) that cover the
+       month (cf. `calendar.Calendar.itermonthdates`).
+
+       The grids are shared by all Month objects.  The cache holds 1200
+       grids, i.e. 100 years' worth of months for a single `firstweekday`
+       (Month objects use Monday unless `Month.calendar` is changed).
+    """
+    first = datetime.date(year, month, 1).toordinal()
+    nextmonth = datetime.date(year + month // 12, month % 12 + 1, 1).toordinal()
+    # ordinal 1 (Jan 1st of year 1) is a Monday.
+    start = first - (first - 1 - firstweekday) % 7
+    end = nextmonth + (start - nextmonth) % 7
+    weeks = tuple(isocalendar(wkstart + 3)[:2] for wkstart in range(start, end, 7))
+    return MonthGrid(start, end, weeks)
 
 
 def rangetuple(x: Any) -> Union[Tuple[datetime.datetime, datetime.datetime], Any]:
@@ -104,3 +209,63 @@ def rangecmp(interval_a: Tuple[datetime.datetime, datetime.datetime],
     if b > c:  # pragma: nocover
         return 1
     raise ValueError(a, b, c, d)  # pragma: no cover
+
+
+def span(x: Any) -> Optional[Tuple[int, int]]:
+    """Return the ordinal span of `x` as a half-open interval.
+
+       Args:
+           x: A ttcal period (anything with a `span` attribute that is a
+              (start, end) tuple), or a datetime.date/datetime.datetime
+              (which covers its whole day).
+
+       Returns:
+           A tuple (start_ordinal, end_ordinal), or None if `x` doesn't
+           represent a span of days (e.g. a `re.Match`, whose `span` is a
+           method).
+    """
+    s = getattr(x, 'span', None)
+    if type(s) is tuple and len(s) == 2:  # pylint:disable=unidiomatic-typecheck
+        return s
+    if isinstance(x, datetime.date):
+        n = x.toordinal()
+        return n, n + 1
+    return None
+
+
+def spancmp(span_a: Tuple[int, int], span_b: Tuple[int, int]) -> int:
+    """Compare non-empty half-open ordinal intervals.
+
+       This is `rangecmp` for integer spans, i.e. two spans compare equal
+       if there is any overlap.
+
+       Returns:
+           -1 if span_a is entirely before span_b,
+           0 if they overlap,
+           1 if span_a is entirely after span_b.
+    """
+    if span_a[1] <= span_b[0]:
+        return -1
+    if span_b[1] <= span_a[0]:
+        return 1
+    return 0
+
+
+def periodcmp(x: Any, other: Any) -> Optional[int]:
+    """Compare the period `x` with `other` using range semantics.
+
+       Integer spans are used whenever `other` has one (ttcal periods,
+       dates and datetimes).  Other objects with a `rangetuple()` method
+       are compared using datetime intervals.
+
+       Returns:
+           -1, 0, or 1 (cf. `rangecmp`), or None if `other` isn't
+           comparable to a period.
+    """
+    othr = span(other)
+    if othr is not None:
+        return spancmp(x.span, othr)
+    othr = rangetuple(other)
+    if othr is other:
+        return None
+    return rangecmp(x.rangetuple(), othr)
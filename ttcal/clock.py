@@ -0,0 +1,104 @@
+"""
+Where ttcal gets "today" from.
+
+Outside of a `Clock` scope every lookup asks the system clock.  Inside a
+scope, today is resolved once (and its ordinal cached), which makes
+rendering a calendar cheaper and tests deterministic::
+
+    with Clock():                               # e.g. once per request
+        html = render(Year())
+
+    with Clock(datetime.date(2024, 2, 29)):     # fixed date
+        assert Day() == Day(2024, 2, 29)
+
+Scopes are stored in a contextvar, so they are local to the current
+thread/task.  In Django, add ``'ttcal.clock.ClockMiddleware'`` to
+``MIDDLEWARE`` to get one scope per request.
+"""
+from __future__ import annotations
+import contextvars
+import datetime
+from typing import Any, Callable, List, Optional
+
+_current: contextvars.ContextVar[Optional[Clock]] = contextvars.ContextVar('ttcal_clock', default=None)
+
+
+class Clock:
+    """A scope where "today" is a single, fixed date.
+
+       Args:
+           today: The date to use as today.  If None, the system clock is
+               asked (once) the first time today is needed.
+    """
+    __slots__ = ('_today', '_ordinal', '_tokens')
+
+    def __init__(self, today: Optional[datetime.date] = None) -> None:
+        self._today: Optional[datetime.date] = None
+        self._ordinal = 0
+        self._tokens: List[contextvars.Token] = []
+        if today is not None:
+            self._set(today)
+
+    def _set(self, today: datetime.date) -> None:
+        self._today = datetime.date(today.year, today.month, today.day)
+        self._ordinal = self._today.toordinal()
+
+    def today(self) -> datetime.date:
+        """Return today's date (as a datetime.date).
+        """
+        if self._today is None:
+            self._set(datetime.date.today())
+        return self._today
+
+    @property
+    def ordinal(self) -> int:
+        """The ordinal of today.
+        """
+        if self._today is None:
+            self._set(datetime.date.today())
+        return self._ordinal
+
+    def __enter__(self) -> Clock:
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        _current.reset(self._tokens.pop())
+
+    def __repr__(self) -> str:
+        return f'Clock({self._today!r})'
+
+
+def current() -> Optional[Clock]:
+    """Return the innermost active Clock, or None.
+    """
+    return _current.get()
+
+
+def today() -> datetime.date:
+    """Return today's date, from the active Clock if there is one.
+    """
+    clock = _current.get()
+    if clock is None:
+        return datetime.date.today()
+    return clock.today()
+
+
+def today_ordinal() -> int:
+    """Return the ordinal of today, from the active Clock if there is one.
+    """
+    clock = _current.get()
+    if clock is None:
+        return datetime.date.today().toordinal()
+    return clock.ordinal
+
+
+class ClockMiddleware:
+    """Django middleware that resolves "today" once per request.
+    """
+    def __init__(self, get_response: Callable[[Any], Any]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: Any) -> Any:
+        with Clock():
+            return self.get_response(request)
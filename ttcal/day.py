@@ -4,9 +4,13 @@ Date (single day) operations.
 import calendar
 import datetime
 import re
+import threading
+from collections import OrderedDict, namedtuple
 from typing import List, Tuple
-from .calfns import rangecmp, rangetuple
+from . import clock
+from .calfns import isocalendar, periodcmp, span, spancmp
 from .duration import Duration, Period
+from .formatter import compile_format
 
 
 class fstr(str):
@@ -71,9 +75,159 @@ def fjoin(strings: List[str], *ndxs: Tuple[int]) -> str:
     return fstr.join(strings, *ndxs)
 
 
+_DATE_RE = re.compile(r"""
+        (?:\s*)
+        (?P<isodate>
+          (?P<iso_yr>[12]\d{3})
+          (?P<sep>[-./\s])
+          (?P<iso_mnth>0[1-9]|1[012]|[1-9])
+          (?P=sep)
+          (?P<iso_day>3[01]|[12]\d|0[1-9]|[1-9]))
+        |(?P<dmy>
+          (?P<dmy_day>3[01]|[12]\d|0[1-9]|\d)
+          (?P<dmy_sep>[-./\s])
+          (?P<dmy_mnth>0[1-9]|1[012]|\d)
+          (?P=dmy_sep)
+          (?P<dmy_yr>[12]\d{3}))
+        |(?P<nsp>
+          (?P<nsp_day>3[01]|[12]\d|0[1-9])
+          (?P<nsp_mnth>0[1-9]|1[012])
+          (?P<nsp_yr>[12]\d{3}))
+        |(?P<isonsp>
+          (?P<isonsp_yr>20[1-5]\d)
+          (?P<isonsp_mnth>0[1-9]|1[012])
+          (?P<isonsp_day>3[01]|[12]\d|0[1-9]))
+        |(?P<two>
+          (?P<two_day>3[01]|[12]\d|0[1-9]|\d)
+          (?P<two_sep>[./\s])
+          (?P<two_mnth>0[1-9]|1[012]|\d)
+          (?P=two_sep)
+          (?P<two_yr>[1-9]\d))
+        (?:\s*)
+    """, re.VERBOSE)
+
+# group numbers of the (day, month, year) fields in each branch of _DATE_RE.
+_DATE_FIELDS = {
+    branch: tuple(_DATE_RE.groupindex[f'{prefix}_{val}'] for val in ['day', 'mnth', 'yr'])
+    for branch, prefix in [('isodate', 'iso'), ('dmy', 'dmy'), ('nsp', 'nsp'),
+                           ('isonsp', 'isonsp'), ('two', 'two')]
+}
+
+
+def _parse_datetuple(strval):
+    """Parse a (non-empty) date string into a (year, month, day) tuple.
+
+       The common fixed width formats (yyyy-mm-dd, dd.mm.yyyy, and
+       ddmmyyyy) are handled without the regular expression, when they
+       can't mean anything else.
+    """
+    n = len(strval)
+    if n == 10 and strval.isascii():
+        if strval[4] == strval[7] == '-' and strval[0] in '12':
+            y, m, d = strval[:4], strval[5:7], strval[8:]
+        elif strval[2] == strval[5] and strval[2] in '-./' and strval[6] in '12':
+            d, m, y = strval[:2], strval[3:5], strval[6:]
+        else:
+            y = m = d = ''
+        if y.isdigit() and m.isdigit() and d.isdigit():
+            month, day = int(m), int(d)
+            if 1 <= month <= 12 and 1 <= day <= 31:
+                return int(y), month, day
+    elif n == 8 and strval.isascii() and strval.isdigit() and strval[4] in '12':
+        month, day = int(strval[2:4]), int(strval[:2])
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            return int(strval[4:]), month, day
+
+    m = _DATE_RE.match(strval)
+    if not m:
+        raise ValueError(f"Cannot parse {strval!r} as date.")
+    day, month, year = [int(m.group(i)) for i in _DATE_FIELDS[m.lastgroup]]
+
+    if year < 13:
+        raise ValueError(f"Cannot parse {strval!r} as date.")
+    if year < 100:
+        year += 2000
+    return year, month, day
+
+
+def _parse_many(cls, iterable, errors):
+    """Generator implementing `Day.parse_many`.
+    """
+    parse = _parse_datetuple
+    raise_errors = errors == 'raise'
+    yield_errors = errors == 'collect'
+
+    for strval in iterable:
+        if not strval or not strval.strip():
+            yield None
+            continue
+        try:
+            y, m, d = parse(strval)
+            yield cls(y, m, d)
+        except ValueError as e:
+            if raise_errors:
+                raise
+            yield e if yield_errors else None
+
+
+DayCacheInfo = namedtuple('DayCacheInfo', 'hits misses maxsize currsize')
+
+
+class _DayCache:
+    """LRU-bounded store of shared Day instances, keyed by
+       (ordinal, membermonth).
+
+       The lookup/reorder/evict steps are done under a lock, so the cache
+       can be shared by threads (e.g. Django request threads).
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def intern(self, obj, membermonth):
+        """Return the shared instance equal to `obj` (and `membermonth`),
+           making `obj` the shared instance if there isn't one.
+        """
+        key = (obj.toordinal(), membermonth)
+        with self.lock:
+            shared = self.entries.get(key)
+            if shared is not None:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return shared
+
+            self.misses += 1
+            obj.membermonth = membermonth
+            self.entries[key] = obj
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+            return obj
+
+    def clear(self):
+        """Remove all shared instances and reset the statistics.
+        """
+        with self.lock:
+            self.hits = self.misses = 0
+            self.entries.clear()
+
+    def info(self):
+        """Return hit/miss statistics.
+        """
+        with self.lock:
+            return DayCacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+
+# The Day interning cache (None when interning is disabled).
+_day_cache = None
+
+
 class Day(datetime.date):  # pylint:disable=too-many-public-methods
     """A calendar date.
     """
+    __slots__ = ('membermonth', 'mark')
 
     day_name = '''mandag tirsdag onsdag torsdag fredag
                   lørdag søndag'''.split()
@@ -126,66 +280,24 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
             # strval is None or contains only spaces
             return None
 
-        datere = re.compile(r"""
-            (?:\s*)
-            (?P<isodate>
-              (?P<iso_yr>[12]\d{3})
-              (?P<sep>[-./\s])
-              (?P<iso_mnth>0[1-9]|1[012]|[1-9])
-              (?P=sep)
-              (?P<iso_day>3[01]|[12]\d|0[1-9]|[1-9]))
-            |(?P<dmy>
-              (?P<dmy_day>3[01]|[12]\d|0[1-9]|\d)
-              (?P<dmy_sep>[-./\s])
-              (?P<dmy_mnth>0[1-9]|1[012]|\d)
-              (?P=dmy_sep)
-              (?P<dmy_yr>[12]\d{3}))
-            |(?P<nsp>
-              (?P<nsp_day>3[01]|[12]\d|0[1-9])
-              (?P<nsp_mnth>0[1-9]|1[012])
-              (?P<nsp_yr>[12]\d{3}))
-            |(?P<isonsp>
-              (?P<isonsp_yr>20[1-5]\d)
-              (?P<isonsp_mnth>0[1-9]|1[012])
-              (?P<isonsp_day>3[01]|[12]\d|0[1-9]))
-            |(?P<two>
-              (?P<two_day>3[01]|[12]\d|0[1-9]|\d)
-              (?P<two_sep>[./\s])
-              (?P<two_mnth>0[1-9]|1[012]|\d)
-              (?P=two_sep)
-              (?P<two_yr>[1-9]\d))
-            (?:\s*)
-        """, re.VERBOSE)
-        m = datere.match(strval)
-        if not m:
-            raise ValueError(f"Cannot parse {strval!r} as date.")
-        prefix = ''
-
-        g = m.groupdict()
-        if g['isodate']:
-            prefix = 'iso'
-
-        elif g['dmy']:
-            prefix = 'dmy'
-
-        elif g['nsp']:
-            prefix = 'nsp'
-
-        elif g['isonsp']:
-            prefix = 'isonsp'
-
-        elif g['two']:
-            prefix = 'two'
-
-        day, month, year = (int(g[f'{prefix}_{val}'])
-                            for val in ['day', 'mnth', 'yr'])
-
-        if year < 13:
-            raise ValueError(f"Cannot parse {strval!r} as date.")
-        if year < 100:
-            year += 2000
-
-        return cls(year, month, day)
+        return cls(*_parse_datetuple(strval))
+
+    @classmethod
+    def parse_many(cls, iterable, errors='raise'):
+        """Parse an iterable of strings, yielding a Day (or None for empty
+           strings) for each of them (cf. `Day.parse`).
+
+           Args:
+               iterable: Strings to parse (e.g. a csv column).
+               errors: What to do with strings that can't be parsed:
+                   'raise' raises ValueError,
+                   'none' yields None,
+                   'collect' yields the ValueError instance, so the
+                   caller can report the bad rows after the import.
+        """
+        if errors not in ('raise', 'none', 'collect'):
+            raise ValueError(f"errors must be 'raise', 'none', or 'collect', not {errors!r}")
+        return _parse_many(cls, iterable, errors)
 
     def __new__(cls, *args, **kw):
         """Create a new Day instance.
@@ -200,13 +312,67 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
             t = args[0]
             y, m, d = t.year, t.month, t.day
         elif len(args) == 0:
-            t = datetime.date.today()
+            t = clock.today()
             y, m, d = t.year, t.month, t.day
         else:
             raise TypeError('incorrect number of arguments')
 
         obj = super().__new__(cls, y, m, d)
-        obj.membermonth = kw.get('membermonth', obj.month)
+        membermonth = kw.get('membermonth', obj.month)
+        if _day_cache is not None and cls is Day:
+            return _day_cache.intern(obj, membermonth)
+        obj.membermonth = membermonth
+        return obj
+
+    @classmethod
+    def enable_cache(cls, maxsize=65536):
+        """Turn on interning of Day objects.
+
+           While enabled, ``Day(y, m, d)``, ``Day.fromordinal(n)`` and
+           ``day + n`` return shared instances from an LRU cache holding
+           at most `maxsize` days.  Shared instances must be treated as
+           immutable, i.e. don't set ``.mark`` on them directly (marking
+           through `Month.mark` replaces the day with a private copy).
+        """
+        global _day_cache  # pylint:disable=global-statement
+        _day_cache = _DayCache(maxsize)
+
+    @classmethod
+    def disable_cache(cls):
+        """Turn off interning of Day objects (and drop the cache).
+        """
+        global _day_cache  # pylint:disable=global-statement
+        _day_cache = None
+
+    @classmethod
+    def cache_info(cls):
+        """Return a DayCacheInfo(hits, misses, maxsize, currsize) tuple,
+           or None if interning is disabled.
+        """
+        if _day_cache is None:
+            return None
+        return _day_cache.info()
+
+    @classmethod
+    def cache_clear(cls):
+        """Empty the interning cache and reset its statistics.
+        """
+        if _day_cache is not None:
+            _day_cache.clear()
+
+    @classmethod
+    def is_cached(cls):
+        """True if Day objects are currently being interned.
+        """
+        return _day_cache is not None
+
+    def copy(self):
+        """Return a private (never shared) copy of `self`.
+        """
+        obj = datetime.date.__new__(type(self), self.year, self.month, self.day)
+        obj.membermonth = self.membermonth
+        if hasattr(self, 'mark'):
+            obj.mark = self.mark
         return obj
 
     @staticmethod
@@ -234,6 +400,14 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
         """
         return self.datetime(), (self + 1).datetime()
 
+    @property
+    def span(self):
+        """Return the (start, end) ordinals of this day
+           (as a half-open interval).
+        """
+        n = self.toordinal()
+        return n, n + 1
+
     def between_tuple(self):
         """Return a tuple of datetimes that is convenient for sql
            `between` queries.
@@ -248,10 +422,9 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
         middle = (self.first.toordinal() + self.last.toordinal()) // 2
         return Day.fromordinal(middle)
 
-    def __hash__(self):
-        """Return hash value for Day objects.
-        """
-        return hash(f'{self.year:04}{self.month:02}{self.day:02}')
+    # Days hash like the datetime.date with the same value (Day objects
+    # compare equal to such dates), without creating any objects.
+    __hash__ = datetime.date.__hash__
 
     def __repr__(self):
         """Return the string representation of the Day object.
@@ -367,13 +540,13 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
     def weeknum(self):
         """Return the isoweek of `self`.
         """
-        return self.isocalendar()[1]
+        return isocalendar(self.toordinal(), self.year)[1]
 
     @property
     def isoyear(self):
         """Return the `isoyear` of `self`.
         """
-        return self.isocalendar()[0]
+        return isocalendar(self.toordinal(), self.year)[0]
 
     # week, Month, and Year, are added later (don't uncomment them here, since
     # that leads to nasty circular dependencies.
@@ -427,7 +600,7 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
     def today(self):  # pylint:disable=arguments-differ,invalid-overridden-method
         """True if self is today.
         """
-        return self.compare(datetime.date.today()) == 'day'
+        return self.toordinal() == clock.today_ordinal()
 
     @property
     def weekday(self):  # pylint:disable=invalid-overridden-method
@@ -468,34 +641,6 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
             return 'year'
         return None
 
-    def _format(self, fmtchars):
-        """Map single char format codes to values.
-
-           Internal method that maps format characters to their corresponding
-           values for custom date formatting.
-        """
-        # http://blog.tkbe.org/archive/date-filter-cheat-sheet/
-        simplefmt = {
-            'y': lambda: str(self.year)[-2:],
-            'Y': lambda: str(self.year),
-            'W': lambda: str(self.weeknum),
-            'w': lambda: str(self.weekday),
-            'n': lambda: str(self.month),
-            'm': lambda: f'{int(self.month):02}',
-            'b': lambda: self.Month.format('b'),
-            'M': lambda: self.Month.format('M'),
-            'N': lambda: self.Month.format('N'),
-            'F': lambda: self.Month.format('F'),
-            'j': lambda: str(self.day),
-            'd': lambda: f'{int(self.day):02}',
-            'D': lambda: self.dayname[:3],
-            'l': lambda: self.dayname,
-            'z': lambda: str(int(self) - int(Day(self.year, 1, 1))),
-        }
-        ch = ""
-        for ch in fmtchars:
-            yield simplefmt.get(ch, lambda ch=ch: ch)()
-
     def format(self, fmt=None):
         """Emulate Django's date filter.
 
@@ -509,8 +654,7 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
             # pylint:disable=C0301
             # https://docs.djangoproject.com/en/dev/ref/settings/#std:setting-DATE_FORMAT
             fmt = "N j, Y"
-        tmp = list(self._format(list(fmt)))
-        return ''.join(tmp)
+        return compile_format('day', fmt)(self)
 
     def timetuple(self):
         """Create timetuple from datetuple.
@@ -523,42 +667,39 @@ class Day(datetime.date):  # pylint:disable=too-many-public-methods
     def __lt__(self, other):
         """Less than comparison using range semantics.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) < 0
+        c = periodcmp(self, other)
+        return c is not None and c < 0
 
     def __le__(self, other):
         """Less than or equal comparison using range semantics.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) <= 0
+        c = periodcmp(self, other)
+        return c is not None and c <= 0
 
     def __eq__(self, other):
         """Equal comparison using range semantics (overlapping ranges).
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) == 0
+        if isinstance(other, datetime.date):
+            return self.toordinal() == other.toordinal()
+        c = periodcmp(self, other)
+        return c is not None and c == 0
+
+    def __ne__(self, other):
+        """Not equal comparison.
+        """
+        return not self == other
 
     def __gt__(self, other):
         """Greater than comparison using range semantics.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) > 0
+        c = periodcmp(self, other)
+        return c is not None and c > 0
 
     def __ge__(self, other):
         """Greater than or equal comparison using range semantics.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) >= 0
+        c = periodcmp(self, other)
+        return c is not None and c >= 0
 
 
 class Today(Day):
@@ -567,12 +708,14 @@ class Today(Day):
        Always represents the current date regardless of construction arguments.
        Has a special 'today' attribute set to True for template checking.
     """
+    __slots__ = ()
+
     def __new__(cls, *args, **kw):
         """Create a Today instance for the current date.
 
            Ignores all arguments and always returns today's date.
         """
-        t = datetime.date.today()
+        t = clock.today()
         y, m, d = t.year, t.month, t.day
         obj = super().__new__(cls, y, m, d)
         obj.membermonth = obj.month
@@ -586,7 +729,16 @@ class Days(list):
 
        Represents a range of consecutive days as a list, with convenience
        methods for accessing first/last days and range operations.
+
+       The days are stored as a range of ordinals, and Day objects are
+       only created when they are first accessed (and then kept, so
+       ``days[0] is days[0]`` and attributes set on the days stay, like
+       in a list).  Slicing returns another (lazy) Days object that shares
+       the Day objects with `self`.  Modifying the list (append, sort,
+       etc.) turns it into a regular list of Day objects.
     """
+    __slots__ = ('_ordinals', '_cache')
+
     def __init__(self, start, end, start_week=False):
         """Initialize a Days object with a range of days.
 
@@ -600,9 +752,138 @@ class Days(list):
             raise ValueError(f'start ({start}) must be <= end ({end})')
         if start_week:
             start = start - start.weekday  # set to monday
+        self._ordinals = range(start.toordinal(), end.toordinal() + 1)
+        self._cache = {}
 
-        for i in range(start.toordinal(), end.toordinal() + 1):
-            self.append(Day.fromordinal(i))
+    @classmethod
+    def _from_range(cls, ordinals, cache=None):
+        """Create a Days object for a range of ordinals (sharing the Day
+           objects in `cache`, a dict from ordinal to Day).
+        """
+        res = list.__new__(cls)
+        res._ordinals = ordinals
+        res._cache = {} if cache is None else cache
+        return res
+
+    def _day(self, ordinal):
+        """Return the Day with the given ordinal, creating it on first use.
+        """
+        d = self._cache.get(ordinal)
+        if d is None:
+            d = self._cache[ordinal] = Day.fromordinal(ordinal)
+        return d
+
+    @property
+    def ordinals(self):
+        """The range of ordinals of the days (None if the list has been
+           modified).
+        """
+        return self._ordinals
+
+    def _materialize(self):
+        """Convert self to a regular list of Day objects (before it is
+           modified).
+        """
+        if self._ordinals is not None:
+            list.extend(self, map(self._day, self._ordinals))
+            self._ordinals = None
+            self._cache = None
+
+    def __reduce__(self):
+        if self._ordinals is None:
+            return _days_from_list, (list(self),)
+        return Days._from_range, (self._ordinals,)
+
+    def __len__(self):
+        if self._ordinals is None:
+            return list.__len__(self)
+        return len(self._ordinals)
+
+    def __getitem__(self, key):
+        if self._ordinals is None:
+            return list.__getitem__(self, key)
+        if isinstance(key, slice):
+            return Days._from_range(self._ordinals[key], self._cache)
+        return self._day(self._ordinals[key])
+
+    def __iter__(self):
+        if self._ordinals is None:
+            return list.__iter__(self)
+        return map(self._day, self._ordinals)
+
+    def __reversed__(self):
+        if self._ordinals is None:
+            return list.__reversed__(self)
+        return map(self._day, reversed(self._ordinals))
+
+    def __contains__(self, day):
+        if self._ordinals is None:
+            return list.__contains__(self, day)
+        if isinstance(day, datetime.date):
+            return day.toordinal() in self._ordinals
+        # periods compare equal to the days they overlap (cf. Day.__eq__)
+        other = span(day)
+        if other is not None and self._ordinals.step == 1:
+            return bool(self._ordinals) and spancmp((self._ordinals.start, self._ordinals.stop), other) == 0
+        return any(d == day for d in self)
+
+    def index(self, day, *args):
+        """Return the index of `day`.
+        """
+        if self._ordinals is None or not isinstance(day, datetime.date):
+            return list(self).index(day, *args)
+        return self._ordinals.index(day.toordinal(), *args)
+
+    def count(self, day):
+        """Return 1 if `day` is in the range, otherwise 0.
+        """
+        return list(self).count(day) if self._ordinals is None else int(day in self)
+
+    def copy(self):
+        """Return a (lazy) copy of `self` (with the same Day objects).
+        """
+        if self._ordinals is None:
+            return _days_from_list(self)
+        return Days._from_range(self._ordinals, self._cache)
+
+    def __eq__(self, other):
+        if self._ordinals is not None and isinstance(other, Days) and other._ordinals is not None:
+            return self._ordinals == other._ordinals
+        if isinstance(other, list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        res = self.__eq__(other)
+        return res if res is NotImplemented else not res
+
+    __hash__ = None
+
+    def __lt__(self, other):
+        return list(self) < list(other)
+
+    def __le__(self, other):
+        return list(self) <= list(other)
+
+    def __gt__(self, other):
+        return list(self) > list(other)
+
+    def __ge__(self, other):
+        return list(self) >= list(other)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, n):
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return repr(list(self))
 
     @property
     def first(self):
@@ -642,3 +923,32 @@ class Days(list):
     #     d = datetime.date(*self.datetuple())
     #     t = datetime.time()
     #     return datetime.datetime.combine(d, t)
+
+
+def _days_from_list(days):
+    """Create a (materialized) Days object from a list of days.
+    """
+    res = list.__new__(Days)
+    res._ordinals = None  # pylint:disable=protected-access
+    res._cache = None  # pylint:disable=protected-access
+    list.extend(res, days)
+    return res
+
+
+def _days_mutator(name):
+    """Return a Days method that materializes the days before calling
+       the list method `name`.
+    """
+    method = getattr(list, name)
+
+    def mutator(self, *args, **kw):
+        self._materialize()  # pylint:disable=protected-access
+        return method(self, *args, **kw)
+    mutator.__name__ = name
+    mutator.__doc__ = method.__doc__
+    return mutator
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'sort', 'reverse',
+              'clear', '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(Days, _name, _days_mutator(_name))
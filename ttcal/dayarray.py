@@ -0,0 +1,297 @@
+"""
+Columnar storage of days (requires numpy).
+
+A DayArray stores days as an int32 array of ordinals and computes the
+calendar fields of all days at once, e.g.::
+
+    >>> days = DayArray.from_period(Year(2024))
+    >>> workdays = days[days.weekday < 5]
+    >>> len(workdays)
+    262
+
+"""
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+import datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: nocover
+    np = None
+
+from .day import Day, Days
+
+# ordinal of 1970-01-01, i.e. the epoch of numpy's datetime64.
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def _require_numpy() -> None:
+    if np is None:  # pragma: nocover
+        raise ImportError('ttcal.DayArray requires numpy (pip install numpy)')
+
+
+def ordinals_to_ymd(ordinals: Any) -> Tuple[Any, Any, Any]:
+    """Return the (years, months, days) arrays for an array of ordinals.
+    """
+    d = (np.asarray(ordinals, dtype=np.int64) - EPOCH_ORDINAL).astype('datetime64[D]')
+    y = d.astype('datetime64[Y]')
+    m = d.astype('datetime64[M]')
+    years = y.astype(np.int64) + 1970
+    months = (m - y).astype(np.int64) + 1
+    days = (d - m).astype(np.int64) + 1
+    return years, months, days
+
+
+def _month_starts(years: Any, months: Any) -> Any:
+    """Return the datetime64[M] values for the given years and months.
+    """
+    return ((np.asarray(years) - 1970) * 12 + np.asarray(months) - 1).astype('datetime64[M]')
+
+
+def month_lengths(years: Any, months: Any) -> Any:
+    """Return the number of days in each (year, month).
+    """
+    m = _month_starts(years, months)
+    return ((m + 1).astype('datetime64[D]') - m.astype('datetime64[D]')).astype(np.int64)
+
+
+def ymd_to_ordinals(years: Any, months: Any, days: Any) -> Any:
+    """Return the ordinals of the dates given as year, month, and day arrays.
+    """
+    first = _month_starts(years, months).astype('datetime64[D]').astype(np.int64)
+    return first + EPOCH_ORDINAL + np.asarray(days) - 1
+
+
+def shift_months(ordinals: Any, months: int) -> Any:
+    """Return the ordinals of the days `months` months after (before, if
+       negative) the days with the given ordinals.  Days past the end of
+       the new month are clamped to its last day (cf. `Period.add_to_day`).
+    """
+    years, mnths, days = ordinals_to_ymd(ordinals)
+    years, mnths = np.divmod(years * 12 + mnths - 1 + months, 12)
+    mnths += 1
+    return ymd_to_ordinals(years, mnths, np.minimum(days, month_lengths(years, mnths)))
+
+
+def year_starts(years: Any) -> Any:
+    """Return the ordinals of January 1st of each of `years`.
+    """
+    y = (np.asarray(years, dtype=np.int64) - 1970).astype('datetime64[Y]')
+    return y.astype('datetime64[D]').astype(np.int64) + EPOCH_ORDINAL
+
+
+class DayArray:
+    """An array of days, stored as ordinals.
+
+       Indexing with an integer returns a Day; slicing, boolean masks, and
+       integer arrays return a new DayArray (sharing data with this one
+       where numpy does).  The calendar fields (`year`, `month`, `day`,
+       `weekday`, `weeknum`, `isoyear`, and `membermonth`) are numpy
+       arrays computed for all days at once.
+    """
+    __slots__ = ('ordinals', '_membermonth')
+    __hash__ = None
+
+    def __init__(self, days: Iterable[datetime.date] = (),
+                 membermonth: Optional[Any] = None) -> None:
+        """Create a DayArray from an iterable of dates (e.g. a Days range,
+           `Month.range()`, or `Year.days()`), another DayArray, or a numpy
+           array of ordinals.
+
+           Args:
+               days: The days.
+               membermonth: Optional array of membermonths (defaults to
+                   the membermonth of the given Day objects, or the month).
+        """
+        _require_numpy()
+        if isinstance(days, DayArray):
+            self.ordinals = days.ordinals
+            self._membermonth = days._membermonth
+        elif isinstance(days, np.ndarray):
+            self.ordinals = days.astype(np.int32, copy=False)
+            self._membermonth = None
+        elif isinstance(days, Days) and days.ordinals is not None:
+            r = days.ordinals
+            self.ordinals = np.arange(r.start, r.stop, r.step, dtype=np.int32)
+            self._membermonth = None
+        else:
+            days = list(days)
+            self.ordinals = np.fromiter((d.toordinal() for d in days),
+                                        dtype=np.int32, count=len(days))
+            self._membermonth = None
+            if any(getattr(d, 'membermonth', d.month) != d.month for d in days):
+                self._membermonth = np.fromiter(
+                    (getattr(d, 'membermonth', d.month) for d in days),
+                    dtype=np.int8, count=len(days))
+        if membermonth is not None:
+            self._membermonth = np.asarray(membermonth, dtype=np.int8)
+
+    @classmethod
+    def range(cls, start: datetime.date, end: datetime.date) -> DayArray:
+        """All days from `start` up to and including `end` (cf. `Days`).
+        """
+        _require_numpy()
+        if start > end:
+            raise ValueError(f'start ({start}) must be <= end ({end})')
+        return cls(np.arange(start.toordinal(), end.toordinal() + 1, dtype=np.int32))
+
+    @classmethod
+    def from_period(cls, period: Any) -> DayArray:
+        """All days in a Week, Month, Quarter, Year, etc.
+        """
+        _require_numpy()
+        start, end = period.span
+        return cls(np.arange(start, end, dtype=np.int32))
+
+    def _new(self, ordinals: Any, membermonth: Optional[Any]) -> DayArray:
+        res = DayArray.__new__(DayArray)
+        res.ordinals = ordinals
+        res._membermonth = membermonth
+        return res
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __getitem__(self, key: Any) -> Union[Day, DayArray]:
+        """Return a Day for integer keys, otherwise a DayArray.
+        """
+        if isinstance(key, (int, np.integer)):
+            n = int(self.ordinals[key])
+            if self._membermonth is None:
+                return Day.fromordinal(n)
+            d = datetime.date.fromordinal(n)
+            return Day(d.year, d.month, d.day, membermonth=int(self._membermonth[key]))
+        mm = None if self._membermonth is None else self._membermonth[key]
+        return self._new(self.ordinals[key], mm)
+
+    def __iter__(self) -> Iterator[Day]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __contains__(self, date: Any) -> bool:
+        if not isinstance(date, datetime.date):
+            return False
+        return bool((self.ordinals == date.toordinal()).any())
+
+    def __repr__(self) -> str:
+        if len(self) > 6:
+            items = [str(d) for d in self[:3]] + ['...'] + [str(d) for d in self[-3:]]
+        else:
+            items = [str(d) for d in self]
+        return f'DayArray([{", ".join(items)}])'
+
+    def _other_ordinals(self, other: Any) -> Any:
+        if isinstance(other, DayArray):
+            return other.ordinals
+        if isinstance(other, datetime.date):
+            return other.toordinal()
+        return NotImplemented
+
+    def __eq__(self, other: Any) -> Any:
+        o = self._other_ordinals(other)
+        return o if o is NotImplemented else self.ordinals == o
+
+    def __ne__(self, other: Any) -> Any:
+        o = self._other_ordinals(other)
+        return o if o is NotImplemented else self.ordinals != o
+
+    def __lt__(self, other: Any) -> Any:
+        o = self._other_ordinals(other)
+        return o if o is NotImplemented else self.ordinals < o
+
+    def __le__(self, other: Any) -> Any:
+        o = self._other_ordinals(other)
+        return o if o is NotImplemented else self.ordinals <= o
+
+    def __gt__(self, other: Any) -> Any:
+        o = self._other_ordinals(other)
+        return o if o is NotImplemented else self.ordinals > o
+
+    def __ge__(self, other: Any) -> Any:
+        o = self._other_ordinals(other)
+        return o if o is NotImplemented else self.ordinals >= o
+
+    @property
+    def first(self) -> Day:
+        """The first day in the array.
+        """
+        return self[0]
+
+    @property
+    def last(self) -> Day:
+        """The last day in the array.
+        """
+        return self[-1]
+
+    @property
+    def year(self) -> Any:
+        """The year of each day.
+        """
+        return ordinals_to_ymd(self.ordinals)[0]
+
+    @property
+    def month(self) -> Any:
+        """The month (1-12) of each day.
+        """
+        return ordinals_to_ymd(self.ordinals)[1]
+
+    @property
+    def day(self) -> Any:
+        """The day of month of each day.
+        """
+        return ordinals_to_ymd(self.ordinals)[2]
+
+    @property
+    def membermonth(self) -> Any:
+        """The month each day belongs to (cf. `Day.membermonth`).
+        """
+        if self._membermonth is None:
+            return self.month
+        return self._membermonth.astype(np.int64)
+
+    @property
+    def weekday(self) -> Any:
+        """The weekday of each day (Monday is 0).
+        """
+        # ordinal 1 (Jan 1st of year 1) is a Monday.
+        return (self.ordinals.astype(np.int64) - 1) % 7
+
+    @property
+    def weekend(self) -> Any:
+        """True for Saturdays and Sundays.
+        """
+        return self.weekday >= 5
+
+    def _iso_thursdays(self) -> Any:
+        """The ordinal of the Thursday in the ISO week of each day.
+        """
+        return self.ordinals.astype(np.int64) - self.weekday + 3
+
+    @property
+    def isoyear(self) -> Any:
+        """The ISO year of each day.
+        """
+        return ordinals_to_ymd(self._iso_thursdays())[0]
+
+    @property
+    def weeknum(self) -> Any:
+        """The ISO week number of each day.
+        """
+        thursdays = self._iso_thursdays()
+        isoyears = ordinals_to_ymd(thursdays)[0]
+        return (thursdays - year_starts(isoyears)) // 7 + 1
+
+    def tolist(self) -> List[Day]:
+        """Return a list of Day objects.
+        """
+        return list(self)
+
+    def to_days(self) -> Days:
+        """Return the (contiguous) days as a `Days` range.
+
+           Raises ValueError if the days are not consecutive.
+        """
+        n = len(self)
+        if n == 0 or not (np.diff(self.ordinals) == 1).all():
+            raise ValueError('Only consecutive days can be converted to Days.')
+        return Days(self.first, self.last)
@@ -0,0 +1,305 @@
+"""
+Sets of days, stored as bitmaps.
+
+A DaySet stores its days as the bits of a Python int (bit ``i`` is the
+day with ordinal ``base + i``), so set algebra is one bitwise operation
+on the whole set instead of hashing and comparing Day objects, e.g.::
+
+    >>> absent = DaySet(Days(Day(2024, 3, 1), Day(2024, 3, 20)))
+    >>> open_days = DaySet(d for d in Month(2024, 3).range() if not d.weekend)
+    >>> len(absent & open_days)
+    14
+
+"""
+from __future__ import annotations
+import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from .calfns import span
+from .day import Day, Days
+
+# the positions of the set bits in each byte value.
+_BYTE_BITS: List[Tuple[int, ...]] = [tuple(i for i in range(8) if b >> i & 1) for b in range(256)]
+
+
+def _span_bits(start: int, end: int) -> Tuple[int, int]:
+    """Return the (base, bits) of the days with ordinals in [start, end).
+    """
+    if start >= end:
+        return 0, 0
+    return start, (1 << (end - start)) - 1
+
+
+def _ordinal_bits(ordinals: Iterable[int]) -> Tuple[int, int]:
+    """Return the (base, bits) of the days with the given ordinals.
+    """
+    ordinals = list(ordinals)
+    if not ordinals:
+        return 0, 0
+    base = min(ordinals)
+    buf = bytearray((max(ordinals) - base) // 8 + 1)
+    for n in ordinals:
+        k = n - base
+        buf[k >> 3] |= 1 << (k & 7)
+    return base, int.from_bytes(buf, 'little')
+
+
+class DaySet:
+    """An (immutable) set of days.
+
+       DaySet objects support the same operations as frozensets, i.e.
+       ``|``, ``&``, ``-``, ``^``, ``<=``, ``<``, ``in``, ``len()`` and the
+       corresponding methods (``union()``, ``intersection()``, ...).
+       Iteration returns Day objects in chronological order.
+    """
+    __slots__ = ('_base', '_bits')
+    _base: int
+    _bits: int
+
+    def __init__(self, days: Any = ()) -> None:
+        """Create a DaySet from `days`, which can be a DaySet, a Day or
+           date, a `Days` range, a period (Week, Month, Quarter, Year, ...),
+           or an iterable of dates.
+        """
+        period_span = span(days)
+        if isinstance(days, DaySet):
+            base, bits = days._base, days._bits
+        elif isinstance(days, Days) and days.ordinals is not None and days.ordinals.step == 1:
+            base, bits = _span_bits(days.ordinals.start, days.ordinals.stop)
+        elif period_span is not None:   # periods, dates, and datetimes
+            base, bits = _span_bits(*period_span)
+        else:
+            base, bits = _ordinal_bits(d.toordinal() for d in days)
+        self._set(base, bits)
+
+    def _set(self, base: int, bits: int) -> None:
+        """Store `bits`, shifted so that the lowest bit is set.
+        """
+        if bits:
+            zeros = (bits & -bits).bit_length() - 1
+            bits >>= zeros
+            base += zeros
+        else:
+            base = 0
+        self._base = base
+        self._bits = bits
+
+    @classmethod
+    def _new(cls, base: int, bits: int) -> DaySet:
+        res = cls.__new__(cls)
+        res._set(base, bits)
+        return res
+
+    @classmethod
+    def from_ordinals(cls, ordinals: Iterable[int]) -> DaySet:
+        """Create a DaySet from day ordinals.
+        """
+        return cls._new(*_ordinal_bits(ordinals))
+
+    @classmethod
+    def from_span(cls, start: int, end: int) -> DaySet:
+        """Create a DaySet of the days with ordinals in [start, end).
+        """
+        return cls._new(*_span_bits(start, end))
+
+    def _coerce(self, other: Any) -> DaySet:
+        return other if isinstance(other, DaySet) else DaySet(other)
+
+    def _aligned(self, other: DaySet) -> Tuple[int, int, int]:
+        """Return (base, self bits, other bits) relative to a common base.
+        """
+        base = min(self._base, other._base)
+        return (base,
+                self._bits << (self._base - base),
+                other._bits << (other._base - base))
+
+    # set algebra
+
+    def __or__(self, other: Any) -> DaySet:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        base, a, b = self._aligned(other)
+        return DaySet._new(base, a | b)
+
+    def __and__(self, other: Any) -> DaySet:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        base, a, b = self._aligned(other)
+        return DaySet._new(base, a & b)
+
+    def __sub__(self, other: Any) -> DaySet:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        base, a, b = self._aligned(other)
+        return DaySet._new(base, a & ~b)
+
+    def __xor__(self, other: Any) -> DaySet:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        base, a, b = self._aligned(other)
+        return DaySet._new(base, a ^ b)
+
+    def union(self, *others: Any) -> DaySet:
+        """Return the days that are in self or any of `others`.
+        """
+        res = self
+        for other in others:
+            res = res | self._coerce(other)
+        return res
+
+    def intersection(self, *others: Any) -> DaySet:
+        """Return the days that are in self and all of `others`.
+        """
+        res = self
+        for other in others:
+            res = res & self._coerce(other)
+        return res
+
+    def difference(self, *others: Any) -> DaySet:
+        """Return the days that are in self, but not in any of `others`.
+        """
+        res = self
+        for other in others:
+            res = res - self._coerce(other)
+        return res
+
+    def symmetric_difference(self, other: Any) -> DaySet:
+        """Return the days that are in exactly one of self and `other`.
+        """
+        return self ^ self._coerce(other)
+
+    def isdisjoint(self, other: Any) -> bool:
+        """True if self and `other` have no days in common.
+        """
+        return not self & self._coerce(other)
+
+    def issubset(self, other: Any) -> bool:
+        """True if every day in self is in `other`.
+        """
+        return self <= self._coerce(other)
+
+    def issuperset(self, other: Any) -> bool:
+        """True if every day in `other` is in self.
+        """
+        return self >= self._coerce(other)
+
+    # comparisons
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        return self._base == other._base and self._bits == other._bits
+
+    def __ne__(self, other: Any) -> bool:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        return not self == other
+
+    def __hash__(self) -> int:
+        return hash((self._base, self._bits))
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        _, a, b = self._aligned(other)
+        return a & ~b == 0
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        return self <= other and self != other
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        return other <= self
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, DaySet):
+            return NotImplemented
+        return other < self
+
+    # container protocol
+
+    def __len__(self) -> int:
+        return bin(self._bits).count('1')
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __contains__(self, day: Any) -> bool:
+        if not isinstance(day, datetime.date):
+            return False
+        n = day.toordinal() - self._base
+        return n >= 0 and (self._bits >> n) & 1 == 1
+
+    def ordinals(self) -> Iterator[int]:
+        """Yield the ordinals of the days, in order.
+        """
+        base = self._base
+        nbytes = (self._bits.bit_length() + 7) // 8
+        for k, byte in enumerate(self._bits.to_bytes(nbytes, 'little')):
+            if byte:
+                for i in _BYTE_BITS[byte]:
+                    yield base + 8 * k + i
+
+    def __iter__(self) -> Iterator[Day]:
+        return map(Day.fromordinal, self.ordinals())
+
+    def spans(self) -> Iterator[Tuple[int, int]]:
+        """Yield the (start, end) ordinals of each run of consecutive days
+           (`end` is exclusive).
+        """
+        bits = self._bits
+        starts = bits & ~(bits << 1)
+        ends = (bits << 1) & ~bits   # the bit after the last day of each run
+        while starts:
+            start = (starts & -starts).bit_length() - 1
+            end = (ends & -ends).bit_length() - 1
+            yield self._base + start, self._base + end
+            starts &= starts - 1
+            ends &= ends - 1
+
+    def ranges(self) -> Iterator[Days]:
+        """Yield each run of consecutive days as a `Days` range.
+        """
+        for start, end in self.spans():
+            yield Days(Day.fromordinal(start), Day.fromordinal(end - 1))
+
+    def to_days(self) -> Days:
+        """Return the (consecutive) days as a `Days` range.
+
+           Raises ValueError if the days are not consecutive.
+        """
+        if not self._bits or self._bits & (self._bits + 1):
+            raise ValueError('Only consecutive days can be converted to Days.')
+        return Days(self.first, self.last)
+
+    @property
+    def first(self) -> Optional[Day]:
+        """The first day in the set (None if the set is empty).
+        """
+        if not self._bits:
+            return None
+        return Day.fromordinal(self._base)
+
+    @property
+    def last(self) -> Optional[Day]:
+        """The last day in the set (None if the set is empty).
+        """
+        if not self._bits:
+            return None
+        return Day.fromordinal(self._base + self._bits.bit_length() - 1)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[int, int]]:
+        return DaySet._new, (self._base, self._bits)
+
+    def __repr__(self) -> str:
+        runs = []
+        for start, end in self.spans():
+            first = Day.fromordinal(start).isoformat()
+            if end - start == 1:
+                runs.append(first)
+            else:
+                runs.append(f'{first}..{Day.fromordinal(end - 1).isoformat()}')
+        return f'DaySet([{", ".join(runs)}])'
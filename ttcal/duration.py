@@ -4,6 +4,80 @@ Extension of datetime.timedelta.
 import datetime
 import re
 
+from .calfns import days_in_month, month_serial, serial_month
+
+
+_DURATION_RE = re.compile(r"""
+    (?:
+        (?P<negation>-)
+    )?
+    (?:
+        (?P<weeks>\d+) \W* (?:weeks?|w),?
+    )?
+    \W*
+    (?:
+        (?P<days>\d+) \W* (?:days?|d),?
+    )?
+    \W*
+    (?:
+        (?P<hours>\d+):
+        (?P<minutes>\d+)
+        (?::(?P<seconds>\d+)
+        (?:\.(?P<microseconds>\d+))?)?
+    )?
+    """, re.VERBOSE)
+
+
+def _parse_hms(txt):
+    """Return the number of seconds in `txt` if it is a plain [-]H:MM or
+       [-]H:MM:SS string (the common case), otherwise None.
+    """
+    sign = 1
+    if txt[0] == '-':
+        sign = -1
+        txt = txt[1:]
+    parts = txt.split(':')
+    if not 2 <= len(parts) <= 3 or not all(p.isdigit() and p.isascii() for p in parts):
+        return None
+    secs = int(parts[0]) * 3600 + int(parts[1]) * 60
+    if len(parts) == 3:
+        secs += int(parts[2])
+    return sign * secs
+
+
+def _decompose(seconds):
+    """Return the (sign, hours, minutes, seconds) tuple of a number of
+       seconds.
+    """
+    sign = ''
+    if seconds < 0:
+        sign = '-'
+        seconds = -seconds
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return sign, hours, minutes, seconds
+
+
+def _parse_many(cls, iterable, errors):
+    """Generator for `Duration.parse_many`.
+    """
+    for txt in iterable:
+        try:
+            yield cls.parse(txt, raise_on_error=True)
+        except ValueError as e:
+            if errors == 'raise':
+                raise
+            yield e if errors == 'collect' else None
+
+
+def _shift_many(days, months):
+    """Shift `days` by `months` months (cf. `Period.add_to_many`).
+    """
+    from .dayarray import DayArray, np, shift_months  # numpy is optional
+    if np is not None and isinstance(days, np.ndarray):
+        return shift_months(days, months).astype(days.dtype, copy=False)
+    return DayArray(shift_months(DayArray(days).ordinals, months))
+
 
 class Period:
     """A semantic time period which doesn't need to be of fixed duration,
@@ -21,14 +95,32 @@ class Period:
     def add_to_day(self, cls, d):
         """Add this period to a day, returning a new day.
         """
-        ym = d.Month + self.months
-        return cls(ym.year, ym.month, min(d.day, ym.daycount))
+        year, month = serial_month(month_serial(d.year, d.month) + self.months)
+        return cls(year, month, min(d.day, days_in_month(year, month)))
 
     def sub_from_day(self, cls, d):
         """Subtract this period from a day, returning a new day.
         """
-        ym = d.Month - self.months
-        return cls(ym.year, ym.month, min(d.day, ym.daycount))
+        year, month = serial_month(month_serial(d.year, d.month) - self.months)
+        return cls(year, month, min(d.day, days_in_month(year, month)))
+
+    def add_to_many(self, days):
+        """Add this period to each of `days` (requires numpy).
+
+           Args:
+               days: A numpy array of ordinals, a DayArray, a Days range,
+                   or an iterable of dates.
+
+           Returns a numpy array of ordinals (with the same dtype) for an
+           array of ordinals, otherwise a DayArray.  The days are the same
+           as `add_to_day` returns.
+        """
+        return _shift_many(days, self.months)
+
+    def sub_from_many(self, days):
+        """Subtract this period from each of `days` (cf. `add_to_many`).
+        """
+        return _shift_many(days, -self.months)
 
     def __repr__(self):
         """Return string representation of the period.
@@ -73,20 +165,46 @@ class Period:
 class Duration(datetime.timedelta):
     """A fixed duration of time.
     """
+    @classmethod
+    def _new(cls, days, seconds):
+        """Create a Duration directly from (integer) days and seconds.
+        """
+        return datetime.timedelta.__new__(cls, days, seconds)
+
     @classmethod
     def sum(cls, sequence, start=None):
         """Return the sum of a sequence of Duration objects.
 
+           The sum is accumulated as an integer number of seconds
+           (sub-second parts of the items are ignored, as Durations have
+           whole seconds).
+
            Args:
                sequence: Iterable of Duration objects to sum.
                start: Optional starting Duration. Defaults to Duration(0).
         """
-        if start is None:
-            start = cls(0)
-        res = start
+        total = 0 if start is None else start.days * 86400 + start.seconds
         for item in sequence:
-            res += item
-        return res
+            total += item.days * 86400 + item.seconds
+        return cls._new(0, total)
+
+    @classmethod
+    def sum_by(cls, key, items, value=None):
+        """Return a dict mapping key(item) to the sum of the Durations of
+           the items with that key (in order of first appearance).
+
+           Args:
+               key: Function returning the group of an item.
+               items: Iterable of items (e.g. timesheet lines).
+               value: Function returning the Duration of an item.
+                   Defaults to the item itself.
+        """
+        totals = {}
+        for item in items:
+            d = item if value is None else value(item)
+            k = key(item)
+            totals[k] = totals.get(k, 0) + d.days * 86400 + d.seconds
+        return {k: cls._new(0, total) for k, total in totals.items()}
 
     @classmethod
     def parse(cls, txt, raise_on_error=False):
@@ -100,49 +218,41 @@ class Duration(datetime.timedelta):
         if not txt:
             return None
 
-        time_matcher = re.compile(r"""
-            (?:
-                (?P<negation>-)
-            )?
-            (?:
-                (?P<weeks>\d+) \W* (?:weeks?|w),?
-            )?
-            \W*
-            (?:
-                (?P<days>\d+) \W* (?:days?|d),?
-            )?
-            \W*
-            (?:
-                (?P<hours>\d+):
-                (?P<minutes>\d+)
-                (?::(?P<seconds>\d+)
-                (?:\.(?P<microseconds>\d+))?)?
-            )?
-            """, re.VERBOSE)
-        time_matches = time_matcher.match(txt)
+        secs = _parse_hms(txt)
+        if secs is not None:
+            return cls(seconds=secs)
+
+        time_matches = _DURATION_RE.match(txt)
         if raise_on_error and not time_matches:
             raise ValueError(f"Couldn't parse {txt} as a duration.")
-        if raise_on_error and time_matches.span()[1] != len(txt):
-            raise ValueError(f"Remaining text: {txt[time_matches.span()[1]:]} could not be parsed as a duration.")
-        time_groups = time_matches.groupdict()
-        keys = list(time_groups.keys())
-
-        if time_groups.get('negation') == '-':
-            scale = -1
-            keys.remove('negation')
-        else:
-            scale = 1
-
-        for key in keys:
-            time_groups[key] = int(time_groups[key]) if time_groups[key] else 0
-        time_groups["days"] = time_groups["days"] + (time_groups["weeks"] * 7)
+        if raise_on_error and time_matches.end() != len(txt):
+            raise ValueError(f"Remaining text: {txt[time_matches.end():]} could not be parsed as a duration.")
+
+        weeks, days, hours, minutes, seconds = [
+            int(g) if g else 0
+            for g in time_matches.group('weeks', 'days', 'hours', 'minutes', 'seconds')
+        ]
+        secs = (((weeks * 7 + days) * 24 + hours) * 60 + minutes) * 60 + seconds
+        if time_matches.group('negation'):
+            secs = -secs
+        return cls(seconds=secs)
 
-        res = cls(days=time_groups["days"],
-                  hours=time_groups["hours"],
-                  minutes=time_groups["minutes"],
-                  seconds=time_groups["seconds"])
+    @classmethod
+    def parse_many(cls, iterable, errors='raise'):
+        """Parse an iterable of strings, yielding a Duration (or None for
+           empty strings) for each of them (cf. `Duration.parse`).
 
-        return res * scale
+           Args:
+               iterable: Strings to parse (e.g. a csv column).
+               errors: What to do with strings that can't be parsed:
+                   'raise' raises ValueError,
+                   'none' yields None,
+                   'collect' yields the ValueError instance, so the
+                   caller can report the bad rows after the import.
+        """
+        if errors not in ('raise', 'none', 'collect'):
+            raise ValueError(f"errors must be 'raise', 'none', or 'collect', not {errors!r}")
+        return _parse_many(cls, iterable, errors)
 
     @classmethod
     def from_secs(cls, s):
@@ -187,13 +297,22 @@ class Duration(datetime.timedelta):
 
     def duration_tuple(self):
         """Return self as a tuple (sign, hours, minutes, seconds).
+
+           The tuple is computed once and cached on the instance.
         """
-        seconds = self.toint()
-        sign = -1 if seconds < 0 else 1
-        seconds *= sign
-        minutes, seconds = divmod(seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return '-' if sign < 0 else '', hours, minutes, seconds
+        res = self.__dict__.get('_decomposition')
+        if res is None:
+            res = self.__dict__['_decomposition'] = _decompose(self.seconds + 86400 * self.days)
+        return res
+
+    @classmethod
+    def decompose_many(cls, durations):
+        """Return the (sign, hours, minutes, seconds) tuple of each of
+           `durations` (cf. `duration_tuple`), e.g. for the rows of a
+           report table.  None values give None.
+        """
+        return [None if d is None else _decompose(d.seconds + 86400 * d.days)
+                for d in durations]
 
     @property
     def hrs(self):
@@ -317,19 +436,19 @@ class Duration(datetime.timedelta):
     def __mul__(self, other):
         """Multiply duration by a scalar.
         """
-        return Duration(super().__mul__(other))
+        return _duration(super().__mul__(other))
 
     def __add__(self, other):
         """Add two durations together.
         """
         """Add two periods together.
         """
-        return Duration(super().__add__(other))
+        return _duration(super().__add__(other))
 
     def __sub__(self, other):
         """Subtract one duration from another.
         """
-        return Duration(super().__sub__(other))
+        return _duration(super().__sub__(other))
 
     def __truediv__(self, other):  # pragma: nocover
         """Divide duration by a scalar or another duration.
@@ -352,3 +471,11 @@ class Duration(datetime.timedelta):
     #
     # def __radd__(self, other):
     #     return other.__add__(self)
+
+
+def _duration(td):
+    """Convert the result of a timedelta operation to a Duration.
+    """
+    if isinstance(td, datetime.timedelta):
+        return Duration._new(td.days, td.seconds)  # pylint:disable=protected-access
+    return Duration(td)
@@ -0,0 +1,208 @@
+"""
+Columnar storage of durations (requires numpy).
+
+A DurationArray stores durations as an int64 array of seconds, so totals,
+means, percentiles, and comparisons are computed for all durations at
+once, e.g.::
+
+    >>> hours = DurationArray.parse(['7:30', '8:00', '', '9:15'])
+    >>> str(hours.sum())
+    '24:45:00'
+    >>> len(hours[hours > Duration(hours=8)])
+    1
+
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, List, Union
+import datetime
+
+try:
+    import numpy as np
+except ImportError:  # pragma: nocover
+    np = None
+
+from .duration import Duration
+
+
+def _require_numpy() -> None:
+    if np is None:  # pragma: nocover
+        raise ImportError('ttcal.DurationArray requires numpy (pip install numpy)')
+
+
+def _duration(seconds: Any) -> Duration:
+    return Duration._new(0, int(seconds))  # pylint:disable=protected-access
+
+
+def _seconds(d: Any) -> int:
+    """The total number of (whole) seconds in the timedelta `d`
+       (None counts as zero).
+    """
+    if d is None:
+        return 0
+    return d.days * 86400 + d.seconds
+
+
+class DurationArray:
+    """An array of durations, stored as whole seconds.
+
+       Indexing with an integer returns a Duration; slicing, boolean masks,
+       and integer arrays return a new DurationArray.  Comparing with a
+       Duration (or timedelta) or another DurationArray returns a boolean
+       numpy array.
+    """
+    __slots__ = ('seconds',)
+    __hash__ = None
+
+    def __init__(self, durations: Iterable[Any] = ()) -> None:
+        """Create a DurationArray from an iterable of Durations/timedeltas
+           (e.g. the output of `Duration.parse_many`, where None counts as
+           zero), another DurationArray, or a numpy array of seconds.
+        """
+        _require_numpy()
+        if isinstance(durations, DurationArray):
+            self.seconds = durations.seconds
+        elif isinstance(durations, np.ndarray):
+            self.seconds = durations.astype(np.int64, copy=False)
+        else:
+            durations = list(durations)
+            self.seconds = np.fromiter(map(_seconds, durations),
+                                       dtype=np.int64, count=len(durations))
+
+    @classmethod
+    def parse(cls, strings: Iterable[str], errors: str = 'raise') -> DurationArray:
+        """Parse an iterable of strings (cf. `Duration.parse_many`).
+
+           Empty strings, and with ``errors='none'`` strings that can't be
+           parsed, count as zero.
+        """
+        if errors not in ('raise', 'none'):
+            raise ValueError(f"errors must be 'raise' or 'none', not {errors!r}")
+        return cls(Duration.parse_many(strings, errors=errors))
+
+    def _new(self, seconds: Any) -> DurationArray:
+        res = DurationArray.__new__(DurationArray)
+        res.seconds = seconds
+        return res
+
+    def __len__(self) -> int:
+        return len(self.seconds)
+
+    def __getitem__(self, key: Any) -> Union[Duration, DurationArray]:
+        """Return a Duration for integer keys, otherwise a DurationArray.
+        """
+        if isinstance(key, (int, np.integer)):
+            return _duration(self.seconds[key])
+        return self._new(self.seconds[key])
+
+    def __iter__(self) -> Iterator[Duration]:
+        return map(_duration, self.seconds.tolist())
+
+    def __repr__(self) -> str:
+        if len(self) > 6:
+            items = self[:3].strings() + ['...'] + self[-3:].strings()
+        else:
+            items = self.strings()
+        return f'DurationArray([{", ".join(items)}])'
+
+    def _other_seconds(self, other: Any) -> Any:
+        if isinstance(other, DurationArray):
+            return other.seconds
+        if isinstance(other, datetime.timedelta):
+            return _seconds(other)
+        return NotImplemented
+
+    def __eq__(self, other: Any) -> Any:
+        o = self._other_seconds(other)
+        return o if o is NotImplemented else self.seconds == o
+
+    def __ne__(self, other: Any) -> Any:
+        o = self._other_seconds(other)
+        return o if o is NotImplemented else self.seconds != o
+
+    def __lt__(self, other: Any) -> Any:
+        o = self._other_seconds(other)
+        return o if o is NotImplemented else self.seconds < o
+
+    def __le__(self, other: Any) -> Any:
+        o = self._other_seconds(other)
+        return o if o is NotImplemented else self.seconds <= o
+
+    def __gt__(self, other: Any) -> Any:
+        o = self._other_seconds(other)
+        return o if o is NotImplemented else self.seconds > o
+
+    def __ge__(self, other: Any) -> Any:
+        o = self._other_seconds(other)
+        return o if o is NotImplemented else self.seconds >= o
+
+    # aggregations
+
+    def _require_items(self, name: str) -> None:
+        if not len(self):
+            raise ValueError(f'{name}() of an empty DurationArray')
+
+    def sum(self) -> Duration:
+        """The total duration.
+        """
+        return _duration(self.seconds.sum())
+
+    def mean(self) -> Duration:
+        """The mean duration (rounded to whole seconds).
+        """
+        self._require_items('mean')
+        return _duration(round(int(self.seconds.sum()) / len(self)))
+
+    def min(self) -> Duration:
+        """The shortest duration.
+        """
+        self._require_items('min')
+        return _duration(self.seconds.min())
+
+    def max(self) -> Duration:
+        """The longest duration.
+        """
+        self._require_items('max')
+        return _duration(self.seconds.max())
+
+    def percentile(self, q: Any) -> Union[Duration, DurationArray]:
+        """The q-th percentile (0 <= q <= 100, rounded to whole seconds).
+
+           Returns a DurationArray if `q` is a sequence of percentiles.
+        """
+        self._require_items('percentile')
+        res = np.rint(np.percentile(self.seconds, q)).astype(np.int64)
+        if res.ndim == 0:
+            return _duration(res)
+        return self._new(res)
+
+    def sum_by(self, keys: Any) -> Dict[Any, Duration]:
+        """Return a dict mapping each of the (sorted) unique `keys` to the
+           total duration of the items with that key, e.g.
+           ``hours.sum_by(days.weeknum)`` for a DayArray `days` of the same
+           length.
+        """
+        keys = np.asarray(keys)
+        if len(keys) != len(self):
+            raise ValueError(f'len(keys) ({len(keys)}) != len(self) ({len(self)})')
+        unique, inverse = np.unique(keys, return_inverse=True)
+        totals = np.zeros(len(unique), dtype=np.int64)
+        np.add.at(totals, inverse.ravel(), self.seconds)
+        return dict(zip(unique.tolist(), map(_duration, totals.tolist())))
+
+    # conversions
+
+    def strings(self) -> List[str]:
+        """Return the durations formatted as ``[-]H:MM:SS`` strings
+           (cf. ``str(Duration)``).
+        """
+        secs = np.abs(self.seconds)
+        minutes, seconds = np.divmod(secs, 60)
+        hours, minutes = np.divmod(minutes, 60)
+        signs = np.where(self.seconds < 0, '-', '')
+        return [f'{sign}{h}:{m:02d}:{s:02d}' for sign, h, m, s in zip(
+            signs.tolist(), hours.tolist(), minutes.tolist(), seconds.tolist())]
+
+    def tolist(self) -> List[Duration]:
+        """Return a list of Duration objects.
+        """
+        return list(self)
@@ -0,0 +1,114 @@
+"""
+Django-style format strings for Day, Month, Quarter, and Year.
+
+A format string is compiled once (per kind of object) into a template and
+a tuple of field extractors, and the compiled formats are cached, e.g.::
+
+    >>> compile_format('day', 'j. F Y')(Day(2024, 3, 1))
+    '1. Mars 2024'
+
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import datetime
+
+# http://blog.tkbe.org/archive/date-filter-cheat-sheet/
+
+MONTH_NAMES: List[str] = [
+    '', 'Januar', 'Februar', 'Mars', 'April', 'Mai', 'Juni', 'Juli',
+    'August', 'September', 'Oktober', 'November', 'Desember'
+]
+
+_YEAR_CODES: Dict[str, Callable[[Any], str]] = {
+    'y': lambda x: str(x.year)[-2:],
+    'Y': lambda x: str(x.year),
+}
+
+_MONTH_CODES: Dict[str, Callable[[Any], str]] = dict(_YEAR_CODES, **{
+    'n': lambda x: str(x.month),
+    'm': lambda x: f'{x.month:02}',
+    'b': lambda x: MONTH_NAMES[x.month][:3].lower(),
+    'M': lambda x: MONTH_NAMES[x.month][:3],
+    # should be AP style, but doesn't make sense outside US.
+    'N': lambda x: MONTH_NAMES[x.month][:3],
+    'F': lambda x: MONTH_NAMES[x.month],
+})
+
+_DAY_CODES: Dict[str, Callable[[Any], str]] = dict(_MONTH_CODES, **{
+    'W': lambda x: str(x.weeknum),
+    'w': lambda x: str(x.weekday),
+    'j': lambda x: str(x.day),
+    'd': lambda x: f'{x.day:02}',
+    'D': lambda x: x.dayname[:3],
+    'l': lambda x: x.dayname,
+    'z': lambda x: str(x.toordinal() - datetime.date(x.year, 1, 1).toordinal()),
+})
+
+_QUARTER_CODES: Dict[str, Callable[[Any], str]] = {
+    'q': lambda x: str(x.quarter),
+    'Q': lambda x: f'{x.year}Q{x.quarter}',
+}
+
+FORMAT_CODES: Dict[str, Dict[str, Callable[[Any], str]]] = {
+    'day': _DAY_CODES,
+    'month': _MONTH_CODES,
+    'quarter': _QUARTER_CODES,
+    'year': _YEAR_CODES,
+}
+
+
+class CompiledFormat:
+    """A format string, compiled for one kind of object.
+
+       Calling it with an object returns the formatted string.
+    """
+    __slots__ = ('fmt', 'template', 'fields')
+
+    def __init__(self, fmt: str, template: str,
+                 fields: Tuple[Callable[[Any], str], ...]) -> None:
+        self.fmt = fmt
+        self.template = template
+        self.fields = fields
+
+    def __call__(self, obj: Any) -> str:
+        """Format `obj`.
+        """
+        return self.template.format(*[f(obj) for f in self.fields])
+
+    def many(self, objs: Iterable[Any]) -> List[str]:
+        """Format each of `objs`.
+        """
+        template = self.template.format
+        fields = self.fields
+        return [template(*[f(obj) for f in fields]) for obj in objs]
+
+    def __repr__(self) -> str:
+        return f'CompiledFormat({self.fmt!r})'
+
+
+@lru_cache(maxsize=512)
+def compile_format(kind: str, fmt: str) -> CompiledFormat:
+    """Compile the format string `fmt` for objects of `kind` ('day',
+       'month', 'quarter', or 'year').  Characters that aren't format codes
+       are copied verbatim.
+    """
+    codes = FORMAT_CODES[kind]
+    template = []
+    fields = []
+    for ch in fmt:
+        if ch in codes:
+            template.append('{}')
+            fields.append(codes[ch])
+        else:
+            template.append(ch.replace('{', '{{').replace('}', '}}'))
+    return CompiledFormat(fmt, ''.join(template), tuple(fields))
+
+
+def format_many(days: Iterable[Any], fmt: Optional[str] = None) -> List[str]:
+    """Format each of `days` (Day objects) according to `fmt` (cf.
+       `Day.format`), compiling the format string only once.
+    """
+    if fmt is None:
+        fmt = "N j, Y"
+    return compile_format('day', fmt).many(days)
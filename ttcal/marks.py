@@ -0,0 +1,151 @@
+"""
+Storage for marks (e.g. absences or holidays) on days.
+
+A MarkStore records marked periods as sorted, non-overlapping, half-open
+intervals of ordinals, so marking a long period costs the same as marking
+a single day::
+
+    >>> marks = MarkStore()
+    >>> marks.mark(Day(2024, 7, 1).toordinal(), Day(2024, 8, 1).toordinal(), 'ferie')
+    >>> marks.get(Day(2024, 7, 15).toordinal())
+    'ferie'
+
+Year, Quarter, and Month objects that are given the same store show the
+same marks.
+"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Optional, Tuple
+
+
+class MarkStore:
+    """Marked periods, stored as sorted and coalesced (start, end, value)
+       intervals of ordinals (`end` is exclusive).
+    """
+    __slots__ = ('_starts', '_ends', '_values', 'version')
+
+    def __init__(self) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._values: List[str] = []
+        # incremented on every change, so views can tell when to refresh.
+        self.version = 0
+
+    def __len__(self) -> int:
+        """The number of (coalesced) intervals.
+        """
+        return len(self._starts)
+
+    def __repr__(self) -> str:
+        return f'MarkStore({list(self.intervals())!r})'
+
+    def get(self, ordinal: int, default: Optional[str] = None) -> Optional[str]:
+        """Return the mark of the day with the given ordinal.
+        """
+        i = bisect_right(self._starts, ordinal) - 1
+        if i >= 0 and ordinal < self._ends[i]:
+            return self._values[i]
+        return default
+
+    def intervals(self, start: Optional[int] = None,
+                  end: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """Yield the (start, end, value) intervals that overlap
+           [start, end), clipped to [start, end).
+        """
+        i = 0
+        if start is not None:
+            i = max(bisect_right(self._starts, start) - 1, 0)
+        for j in range(i, len(self._starts)):
+            s, e = self._starts[j], self._ends[j]
+            if end is not None and s >= end:
+                break
+            if start is not None:
+                if e <= start:
+                    continue
+                s = max(s, start)
+            if end is not None:
+                e = min(e, end)
+            yield s, e, self._values[j]
+
+    def mark(self, start: int, end: int, value: str = 'mark',
+             method: str = 'replace') -> None:
+        """Mark the days with ordinals in [start, end).
+
+           Args:
+               start: Ordinal of the first day.
+               end: Ordinal of the day after the last day.
+               value: The mark.
+               method: 'replace' overwrites existing marks, 'append' adds
+                   `value` to the end of existing marks.
+        """
+        if start >= end:
+            return
+        if method not in ('replace', 'append'):
+            raise ValueError(f"method must be 'replace' or 'append', not {method!r}")
+        starts, ends, values = self._starts, self._ends, self._values
+
+        # the intervals [lo:hi] overlap or touch [start, end)
+        lo = bisect_left(ends, start)
+        hi = bisect_right(starts, end)
+
+        if method == 'replace':
+            new_starts, new_ends, new_values = [start], [end], [value]
+            if lo < hi and starts[lo] < start:
+                if values[lo] == value:
+                    new_starts[0] = starts[lo]
+                else:
+                    new_starts.insert(0, starts[lo])
+                    new_ends.insert(0, start)
+                    new_values.insert(0, values[lo])
+            if lo < hi and ends[hi - 1] > end:
+                if values[hi - 1] == value:
+                    new_ends[-1] = ends[hi - 1]
+                else:
+                    new_starts.append(end)
+                    new_ends.append(ends[hi - 1])
+                    new_values.append(values[hi - 1])
+            starts[lo:hi] = new_starts
+            ends[lo:hi] = new_ends
+            values[lo:hi] = new_values
+            self.version += 1
+            return
+
+        pieces: List[Tuple[int, int, str]] = []
+        pos = start
+        for i in range(lo, hi):
+            s, e, v = starts[i], ends[i], values[i]
+            if e <= start or s >= end:      # only touching
+                pieces.append((s, e, v))
+                continue
+            if s < start:
+                pieces.append((s, start, v))
+            if pos < s:
+                pieces.append((pos, s, value))
+            pieces.append((max(s, start), min(e, end), v + value))
+            pos = min(e, end)
+            if e > end:
+                pieces.append((end, e, v))
+        if pos < end:
+            pieces.append((pos, end, value))
+        pieces.sort()
+
+        # coalesce adjacent pieces with the same value
+        merged: List[Tuple[int, int, str]] = []
+        for s, e, v in pieces:
+            if merged and merged[-1][1] == s and merged[-1][2] == v:
+                merged[-1] = (merged[-1][0], e, v)
+            else:
+                merged.append((s, e, v))
+
+        starts[lo:hi] = [s for s, _, _ in merged]
+        ends[lo:hi] = [e for _, e, _ in merged]
+        values[lo:hi] = [v for _, _, v in merged]
+        self.version += 1
+
+    def clear(self) -> None:
+        """Remove all marks.
+        """
+        self._starts.clear()
+        self._ends.clear()
+        self._values.clear()
+        self.version += 1
@@ -2,7 +2,7 @@
 Month operations.
 """
 from __future__ import annotations
-from typing import Optional, List, Tuple, Union, Iterator, Any, ClassVar, TYPE_CHECKING
+from typing import Dict, Optional, List, Tuple, Union, Iterator, Any, ClassVar, TYPE_CHECKING
 import re
 import calendar
 import datetime
@@ -10,25 +10,26 @@ import datetime
 if TYPE_CHECKING:
     from .year import Year  # noqa
 
+from . import clock
 from .day import Day, Days
 from .week import Week
-from .calfns import chop, rangecmp, rangetuple
+from .calfns import MonthGrid, days_in_month, month_grid, month_serial, periodcmp, serial_month
+from .formatter import MONTH_NAMES, compile_format
+from .marks import MarkStore
 
 
 class Month:  # pylint:disable=too-many-public-methods
     """A calendar month.
     """
 
-    month_name: ClassVar[List[str]] = [
-        '', 'Januar', 'Februar', 'Mars', 'April', 'Mai', 'Juni', 'Juli',
-        'August', 'September', 'Oktober', 'November', 'Desember'
-    ]
-    year: Optional[int] = None
-    month: Optional[int] = None
-    calendar: calendar.Calendar
-    name: str
-    short_name: str
-    weeks: List[Week]
+    month_name: ClassVar[List[str]] = MONTH_NAMES
+    # all months share the same (stateless) calendar instance.
+    calendar: ClassVar[calendar.Calendar] = calendar.Calendar()
+
+    __slots__ = ('year', 'month', 'span', '_cached_weeks', '_marks', '_marks_version', '_synced_marks')
+    year: int
+    month: int
+    span: Tuple[int, int]
 
     @classmethod
     def from_idtag(cls, tag: str) -> Month:
@@ -44,6 +45,23 @@ class Month:  # pylint:disable=too-many-public-methods
         m = int(tag[5:])
         return cls(year=y, month=m)
 
+    @classmethod
+    def from_serial(cls, serial: int) -> Month:
+        """Create the Month with the given serial (cf. `serial`).
+        """
+        year, month = serial_month(serial)
+        return cls(year, month)
+
+    @property
+    def serial(self) -> int:
+        """The number of months since January of year 0.
+
+           Month arithmetic is integer arithmetic on serials, e.g.
+           ``[Month.from_serial(n) for n in range(m.serial, m.serial + 240)]``
+           are the 20 years starting with `m`.
+        """
+        return month_serial(self.year, self.month)
+
     @classmethod
     def from_date(cls, d: Union[datetime.date, Day]) -> Month:
         """Create a Month from the date ``d``.
@@ -54,7 +72,8 @@ class Month:  # pylint:disable=too-many-public-methods
         """Return a datetime tuple representing this month
            (as a half-open interval).
         """
-        return self.first.datetime(), (self.last + 1).datetime()
+        return (datetime.datetime.fromordinal(self.span[0]),
+                datetime.datetime.fromordinal(self.span[1]))
 
     @classmethod
     def parse(cls, txt: Optional[str]) -> Optional[Month]:
@@ -77,13 +96,16 @@ class Month:  # pylint:disable=too-many-public-methods
         return cls(int(mnth_groups["year"]), int(mnth_groups["month"]))
 
     def __init__(self, year: Optional[int] = None, month: Optional[int] = None,
-                 date: Optional[datetime.date] = None) -> None:
+                 date: Optional[datetime.date] = None,
+                 marks: Optional[MarkStore] = None) -> None:
         """Initialize a Month object.
 
            Args:
                year: The year (e.g., 2024)
                month: The month number (1-12)
                date: Optional date object to extract year/month from
+               marks: Optional mark store (shared with other views of
+                   the same dates, cf. `ttcal.marks`).
 
            If no arguments provided, defaults to current month.
            Raises ValueError if month is not in range 1-12.
@@ -93,7 +115,7 @@ class Month:  # pylint:disable=too-many-public-methods
             self.year = date.year
             self.month = date.month
         elif year is month is date is None:
-            td = datetime.date.today()
+            td = clock.today()
             self.year = td.year
             self.month = td.month
         else:
@@ -105,12 +127,83 @@ class Month:  # pylint:disable=too-many-public-methods
         if not 1 <= self.month <= 12:
             raise ValueError("Month must be in 1..12.")
 
-        self.calendar = calendar.Calendar()
-        self.name = self.month_name[self.month]
-        self.short_name = self.name[:3]
-        # self.short_name = calendar.month_abbr[self.month]
-        self.weeks = [Week(days, self.month) for days in self._weeks()]
-        # self.day = 1
+        start = datetime.date(self.year, self.month, 1).toordinal()
+        self.span = start, start + self.daycount
+
+        # the week grid is created on first access (cf. weeks).
+        self._cached_weeks: Optional[List[Week]] = None
+        self._marks = marks
+        self._marks_version = -1
+        # the marks _sync_marks has set on the days, by grid position.
+        self._synced_marks: Dict[int, str] = {}
+
+    @property
+    def weeks(self) -> List[Week]:
+        """The weeks (rows) of the month calendar, incl. days from the
+           adjacent months.
+        """
+        if self._cached_weeks is None:
+            grid = self.grid
+            self._cached_weeks = [
+                Week._from_start(start, self.month, year, num)  # pylint:disable=protected-access
+                for start, (year, num) in zip(range(grid.start, grid.end, 7), grid.weeks)
+            ]
+        if self._marks is not None and self._marks_version != self._marks.version:
+            self._sync_marks()
+        return self._cached_weeks
+
+    @property
+    def marks(self) -> MarkStore:
+        """The mark store of this month (created on first use).
+        """
+        if self._marks is None:
+            self._marks = MarkStore()
+        return self._marks
+
+    def _sync_marks(self) -> None:
+        """Set the `mark` attribute of the days in the calendar from the
+           mark store, and remove the marks it set earlier from days that
+           are no longer marked.  Marks assigned directly to a day (i.e.
+           ``day.mark = ...``) are left alone.
+        """
+        self._marks_version = self._marks.version
+        start, end = self.grid[:2]
+        values: Dict[int, str] = {}
+        for s, e, value in self._marks.intervals(start, end):
+            for n in range(s - start, e - start):
+                values[n] = value
+        synced = self._synced_marks
+        for n, value in synced.items():
+            if n not in values:
+                d = self._cached_weeks[n // 7].days[n % 7]
+                if getattr(d, 'mark', None) == value:
+                    del d.mark
+        for n, value in values.items():
+            if getattr(self._cached_weeks[n // 7].days[n % 7], 'mark', None) != value:
+                self._private_at(n).mark = value
+        self._synced_marks = values
+
+    @property
+    def grid(self) -> MonthGrid:
+        """The (shared, immutable) shape of the month calendar.
+
+           Each Month creates its own Week/Day objects from the grid, so
+           marks set on one Month's days are never visible to other Month
+           objects.
+        """
+        return month_grid(self.year, self.month, self.calendar.firstweekday)
+
+    @property
+    def name(self) -> str:
+        """The name of the month.
+        """
+        return self.month_name[self.month]
+
+    @property
+    def short_name(self) -> str:
+        """The three letter abbreviation of the month name.
+        """
+        return self.month_name[self.month][:3]
 
     def __call__(self, daynum: Optional[int] = None) -> Union[Month, Day]:
         """Return the given Day for this month.
@@ -174,8 +267,7 @@ class Month:  # pylint:disable=too-many-public-methods
     def __len__(self) -> int:
         """Return the number of days in this month.
         """
-        _, n = calendar.monthrange(self.year, self.month)
-        return n
+        return days_in_month(self.year, self.month)
 
     def datetuple(self) -> Tuple[int, int, int]:
         """First date in month.
@@ -188,10 +280,8 @@ class Month:  # pylint:disable=too-many-public-methods
         """
         if isinstance(other, int):
             return self.month < other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) < 0
+        c = periodcmp(self, other)
+        return c is not None and c < 0
 
     def __le__(self, other: Any) -> bool:
         """Less than or equal comparison using range semantics.
@@ -199,10 +289,8 @@ class Month:  # pylint:disable=too-many-public-methods
         """
         if isinstance(other, int):
             return self.month <= other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) <= 0
+        c = periodcmp(self, other)
+        return c is not None and c <= 0
 
     def __eq__(self, other: Any) -> bool:
         """Equal comparison using range semantics (overlapping ranges).
@@ -210,10 +298,8 @@ class Month:  # pylint:disable=too-many-public-methods
         """
         if isinstance(other, int):
             return self.month == other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) == 0
+        c = periodcmp(self, other)
+        return c is not None and c == 0
 
     def __ne__(self, other: Any) -> bool:
         """Not equal comparison.
@@ -226,10 +312,8 @@ class Month:  # pylint:disable=too-many-public-methods
         """
         if isinstance(other, int):
             return self.month > other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) > 0
+        c = periodcmp(self, other)
+        return c is not None and c > 0
 
     def __ge__(self, other: Any) -> bool:
         """Greater than or equal comparison using range semantics.
@@ -237,10 +321,8 @@ class Month:  # pylint:disable=too-many-public-methods
         """
         if isinstance(other, int):
             return self.month >= other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) >= 0
+        c = periodcmp(self, other)
+        return c is not None and c >= 0
 
     def numdays(self) -> int:  # for use in template
         """The number of days in the month.
@@ -250,10 +332,7 @@ class Month:  # pylint:disable=too-many-public-methods
     def __add__(self, n: int) -> Month:
         """Add n months to self.
         """
-        me = self.year * 12 + (self.month - 1)
-        me += n
-        q, r = divmod(me, 12)
-        return Month(q, r + 1)
+        return Month(*serial_month(self.serial + n))
 
     def __radd__(self, n: int) -> Month:
         """Add n months to self (right addition).
@@ -269,13 +348,7 @@ class Month:  # pylint:disable=too-many-public-methods
            Returns: A new Month if n is int, or int difference if n is Month.
         """
         if isinstance(n, Month):
-            first, last = min(self, n), max(self, n)
-            ydiff = last.year - first.year
-            mdiff = last.month - first.month
-            res = 12*ydiff + mdiff
-            if self > n:
-                return res
-            return -res
+            return self.serial - n.serial
         return self + (-n)
 
     # rsub doesn't make sense
@@ -319,10 +392,7 @@ class Month:  # pylint:disable=too-many-public-methods
     def daycount(self) -> int:
         """The number of days in this month (as an int).
         """
-        n = calendar.mdays[self.month]
-        if self.month == 2 and calendar.isleap(self.year):
-            n += 1
-        return n
+        return days_in_month(self.year, self.month)
 
     def prev(self) -> Month:
         """Previous month.
@@ -346,90 +416,91 @@ class Month:  # pylint:disable=too-many-public-methods
         """
         return Day(self.year, self.month, self.daycount)
 
-    def _weeks(self) -> Iterator[List[datetime.date]]:
-        """Generate week-long lists of dates for this month.
-
-           Used internally to construct the weeks attribute.
-        """
-        c = self.calendar
-        return chop(c.itermonthdates(self.year, self.month), 7)
-
     def __contains__(self, date: Any) -> bool:
         """Check if a date is in this month.
         """
         return self.year == date.year and self.month == date.month
 
+    def _offset(self, day: datetime.date) -> int:
+        """Return the position of `day` in the month calendar.  Raises
+           KeyError if `day` is not in the month calendar.
+        """
+        if not isinstance(day, datetime.date):
+            raise KeyError(day)
+        grid = self.grid
+        n = day.toordinal() - grid.start
+        if not 0 <= n < grid.end - grid.start:
+            raise KeyError(day)
+        return n
+
     def __getitem__(self, day: Day) -> Day:
-        """Get a specific day from the month by index.
+        """Get a specific day from the month calendar (including the days
+           from adjacent months).
         """
-        for wk in self.weeks:
-            for d in wk:
-                if d.compare(day) == 'day':
-                    return d
-        raise KeyError
+        n = self._offset(day)
+        return self.weeks[n // 7].days[n % 7]
+
+    def _private_at(self, n: int) -> Day:
+        """Get the day at position `n` of the month calendar, for
+           modification.
+
+           When Day objects are shared (cf. `Day.enable_cache`), the day
+           is first replaced by a private copy, so marks don't leak to other
+           months/weeks that contain the same shared instance.
+        """
+        wk = self._cached_weeks[n // 7]
+        d = wk.days[n % 7]
+        if Day.is_cached() and not hasattr(d, 'mark'):
+            d = wk.days[n % 7] = d.copy()
+        return d
 
     def mark(self, d: Day, value: str = 'mark', method: str = 'replace') -> None:
         """Add a 'mark' to a day in this month.
+
+           Args:
+               d: The day.
+               value: The mark.
+               method: 'replace' or 'append' (to existing marks).
         """
         try:
-            day = self[d]
-            if method == 'replace':
-                day.mark = value
-            elif method == 'append':
-                if hasattr(day, 'mark'):
-                    day.mark += value
-                else:
-                    day.mark = value
-            else:  # pragma: nocover
-                pass
-
-        except KeyError:  # pragma:nocover
-            pass
+            n = self._offset(d)
+        except KeyError:  # days outside the calendar are ignored
+            return
+        if method not in ('replace', 'append'):
+            return
+        ordinal = d.toordinal()
+        if method == 'append' and self._cached_weeks is not None:
+            # keep a mark that was assigned directly to the day
+            current = getattr(self._cached_weeks[n // 7].days[n % 7], 'mark', None)
+            if current is not None and self.marks.get(ordinal) is None:
+                value, method = current + value, 'replace'
+        self.marks.mark(ordinal, ordinal + 1, value, method)
+        if self._cached_weeks is not None:
+            self._sync_marks()
+
+    def mark_period(self, p: Any, value: str = 'mark') -> None:
+        """Add a 'mark' to a series (period) of days (the days outside the
+           month calendar are ignored).
+        """
+        start, end = self.grid[:2]
+        self.marks.mark(max(p.first.toordinal(), start), min(p.last.toordinal() + 1, end), value)
 
     def marked_days(self) -> Iterator[Day]:
-        """Yield all days with marks.
+        """Yield all days in the month calendar (incl. the days from the
+           adjacent months) with marks.
         """
         for wk in self.weeks:
-            for d in wk:
+            for d in wk.days:
                 if hasattr(d, 'mark'):
                     yield d
 
-    def _format(self, fmtchars: List[str]) -> Iterator[str]:
-        """Map single char format codes to values.
-
-           Internal method that maps format characters to their corresponding
-           values for custom month formatting.
-        """
-        # http://blog.tkbe.org/archive/date-filter-cheat-sheet/
-        for ch in fmtchars:
-            if ch == 'y':
-                yield str(self.year)[-2:]
-            elif ch == 'Y':
-                yield str(self.year)
-            elif ch == 'n':
-                yield str(self.month)
-            elif ch == 'm':
-                yield f'{self.month:02}'
-            elif ch == 'b':
-                yield self.name[:3].lower()
-            elif ch == 'M':
-                yield self.name[:3]
-            elif ch == 'N':
-                # should be AP style, but doesn't make sense outside US.
-                yield self.name[:3]
-            elif ch == 'F':
-                yield self.name
-            else:
-                yield ch
-
     def format(self, fmt: Optional[str] = None) -> str:
         """Format according to format string. Default format is
            monthname, four-digit-year.
         """
         if fmt is None:
             fmt = "F, Y"
-        tmp = list(self._format(list(fmt)))
-        return ''.join(tmp)
+        return compile_format('month', fmt)(self)
 
     def range(self) -> Days:
         """Return an iterator for the range of `self`.
@@ -2,37 +2,123 @@
 quarter class.
 """
 from __future__ import annotations
-from typing import Optional, List, Tuple, Iterator, Any
+from typing import Optional, List, Tuple, Iterator, Any, Union
 import datetime
 
-from .calfns import rangecmp, rangetuple
+from . import clock
+from .calfns import periodcmp, quarter_serial, serial_quarter
 from .day import Day
+from .formatter import compile_format
+from .marks import MarkStore
+from .month import Month
 from .year import Year
 
 
 class Quarter:  # pylint:disable=too-many-public-methods
     """A single quarter.
     """
+    __slots__ = ('year', 'quarter', 'span', '_cached_months', '_marks')
     year: int
     quarter: int
-    months: List[Any]  # List[Month]
+    span: Tuple[int, int]
 
-    def __init__(self, year: Optional[int] = None, quarter: Optional[int] = None) -> None:
+    def __init__(self, year: Optional[int] = None, quarter: Optional[int] = None,
+                 marks: Optional[MarkStore] = None) -> None:
         """Initialize a Quarter object.
 
            Args:
                year: The year number. If None, uses the current year.
                quarter: The quarter number (1-4). If None, uses quarter 1.
+               marks: Optional mark store (shared with other views of
+                   the same dates, cf. `ttcal.marks`).
         """
         super().__init__()
         # if quarter is None:
         if year is None:
-            year = datetime.date.today().year
+            year = clock.today().year
         if quarter is None:
             quarter = 1
+        if not 1 <= quarter <= 4:
+            raise ValueError("Quarter must be in 1..4.")
         self.year = year
         self.quarter = quarter
-        self.months = Year(year).quarters()[self.quarter-1]
+
+        first_month = 3 * quarter - 2
+        start = datetime.date(year, first_month, 1).toordinal()
+        if quarter == 4:
+            end = datetime.date(year, 12, 31).toordinal() + 1
+        else:
+            end = datetime.date(year, first_month + 3, 1).toordinal()
+        self.span = start, end
+        # the months are created on first access (cf. months).
+        self._cached_months: Optional[List[Month]] = None
+        self._marks = marks
+
+    @classmethod
+    def from_serial(cls, serial: int) -> Quarter:
+        """Create the Quarter with the given serial (cf. `serial`).
+        """
+        year, quarter = serial_quarter(serial)
+        return cls(year, quarter)
+
+    @property
+    def serial(self) -> int:
+        """The number of quarters since the first quarter of year 0.
+        """
+        return quarter_serial(self.year, self.quarter)
+
+    @property
+    def months(self) -> List[Month]:
+        """The three months of this quarter.
+        """
+        if self._cached_months is None:
+            first_month = 3 * self.quarter - 2
+            marks = self.marks
+            self._cached_months = [Month(self.year, first_month + i, marks=marks)
+                                   for i in range(3)]
+        return self._cached_months
+
+    @property
+    def marks(self) -> MarkStore:
+        """The mark store of this quarter, shared with its months.
+        """
+        if self._marks is None:
+            self._marks = MarkStore()
+        return self._marks
+
+    def __getitem__(self, day: Day) -> Day:
+        """Get a specific day from this quarter.
+        """
+        m = self.months[(day.month - 1) % 3]
+        return m[day]
+
+    def mark_period(self, p: Any, value: str = 'mark') -> None:
+        """Add a 'mark' to a series (period) of days in quarter (the days
+           outside the quarter are ignored).
+        """
+        start, end = self.span
+        self.marks.mark(max(p.first.toordinal(), start), min(p.last.toordinal() + 1, end), value)
+
+    def mark(self, d: Day, value: str = 'mark') -> None:
+        """Add a 'mark' to a day in this quarter (days outside the quarter
+           are ignored).
+        """
+        n = d.toordinal()
+        if self.span[0] <= n < self.span[1]:
+            self.marks.mark(n, n + 1, value)
+
+    def marked_days(self) -> Iterator[Day]:
+        """Yield all 'marked' days in quarter.
+        """
+        for m in self.months:
+            for d in m.marked_days():
+                if d.month == m.month and d.year == m.year:
+                    yield d
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, int]]:
+        """Deepcopy helper.
+        """
+        return Quarter, (self.year, self.quarter)
 
     def __int__(self) -> int:
         """Convert Quarter to integer representation.
@@ -48,7 +134,8 @@ class Quarter:  # pylint:disable=too-many-public-methods
         """Return a pair of datetime objects containing quarter
            (in a half-open interval).
         """
-        return self.first.datetime(), (self + 1).first.datetime()
+        return (datetime.datetime.fromordinal(self.span[0]),
+                datetime.datetime.fromordinal(self.span[1]))
 
     # def __lt__(self, other):
     #     if isinstance(other, int):
@@ -71,10 +158,8 @@ class Quarter:  # pylint:disable=too-many-public-methods
         """
         if isinstance(other, int):
             return self.quarter == other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) == 0
+        c = periodcmp(self, other)
+        return c is not None and c == 0
 
     def __ne__(self, other: Any) -> bool:
         """Compare if this quarter is not equal to another quarter or time range.
@@ -108,15 +193,19 @@ class Quarter:  # pylint:disable=too-many-public-methods
     def first(self) -> Day:
         """Return the first day of the quarter.
         """
-        # The negative indexing here is due to the fact that the
-        # first quarter is list element 0 and so on.
-        return self.Year.quarters()[self.quarter-1][0].first
+        return Day.fromordinal(self.span[0])
 
     @property
     def last(self) -> Day:
         """Return the last day of the quarter.
         """
-        return self.Year.quarters()[self.quarter-1][2].last
+        return Day.fromordinal(self.span[1] - 1)
+
+    @property
+    def daycount(self) -> int:
+        """Return the number of days in the quarter.
+        """
+        return self.span[1] - self.span[0]
 
     def between_tuple(self) -> Tuple[datetime.datetime, datetime.datetime]:  # pylint:disable=E0213
         """Return a tuple of datetimes that is convenient for sql
@@ -132,7 +221,7 @@ class Quarter:  # pylint:disable=too-many-public-methods
         return Year(self.year)
 
     @property
-    def Month(self) -> Any:  # Month
+    def Month(self) -> Month:
         """For orthogonality in the api.
         """
         return self.months[0]
@@ -189,16 +278,19 @@ class Quarter:  # pylint:disable=too-many-public-methods
     def __add__(self, n: int) -> Quarter:
         """Add n quarters to self.
         """
-        return Quarter(self.year, self.quarter + n)
+        return Quarter.from_serial(self.serial + n)
 
     def __radd__(self, n: int) -> Quarter:
         """Add n quarters to self (reverse operation).
         """
         return self + n
 
-    def __sub__(self, n: int) -> Quarter:
-        """Subtract n quarters from self.
+    def __sub__(self, n: Union[int, Quarter]) -> Union[int, Quarter]:
+        """Subtract n quarters from self, or return the number of quarters
+           between self and the Quarter `n`.
         """
+        if isinstance(n, Quarter):
+            return self.serial - n.serial
         return self + (-n)
 
     # rsub doesn't make sense
@@ -216,7 +308,7 @@ class Quarter:  # pylint:disable=too-many-public-methods
     def __hash__(self) -> int:
         """Return hash value for this quarter.
         """
-        return self.quarter
+        return self.year * 10 + self.quarter
 
     def dayiter(self) -> Iterator[Day]:
         """Yield all days in all months in quarter.
@@ -224,23 +316,10 @@ class Quarter:  # pylint:disable=too-many-public-methods
         for m in self.months:
             yield from m.days()
 
-    def _format(self, fmtchars: List[str]) -> Iterator[str]:
-        """Internal formatting helper method.
-        """
-        # http://blog.tkbe.org/archive/date-filter-cheat-sheet/
-        for ch in fmtchars:
-            if ch == 'q':
-                yield str(self.quarter)
-            elif ch == 'Q':
-                yield f'{str(self.year)}Q{self.quarter}'
-            else:
-                yield ch
-
     def format(self, fmt: Optional[str] = None) -> str:
         """Format according to format string. Default format is
            four-digit-year and quarter-number.
         """
         if fmt is None:
             fmt = "Q"
-        tmp = list(self._format(list(fmt)))
-        return ''.join(tmp)
+        return compile_format('quarter', fmt)(self)
@@ -3,18 +3,21 @@ Week class.
 """
 from __future__ import annotations
 from typing import Optional, List, Tuple, Iterator, Any, Union
+from collections.abc import Sequence
 import datetime
+from . import clock
 from .day import Day, Days
-from .calfns import isoweek, rangecmp, rangetuple
+from .calfns import isocalendar, isoweek_start, periodcmp
 
 
 class Week:
     """A single week in a Year.
     """
-    year: Optional[int] = None
-    num: Optional[int] = None
-    days: Optional[List[Day]] = None
-    month: Optional[int] = None
+    __slots__ = ('year', 'num', '_days', 'month', 'span')
+    year: int
+    num: int
+    month: int
+    span: Tuple[int, int]
 
     def range(self) -> Days:
         """Return an iterator for the range of `self`.
@@ -64,12 +67,43 @@ class Week:
                year: The year. If None, uses current year.
         """
         if n is None and year is None:
-            year, n = datetime.date.today().isocalendar()[:2]
+            year, n, _ = isocalendar(clock.today_ordinal())
         if year is None:
-            year = datetime.date.today().year
-        days = list(isoweek(year, n))
-        month = days[0].month  # quite arbitrary
-        return cls(days, month)
+            year = clock.today().year
+        # the week number/year are normalized (e.g. week 0 is the last
+        # week of the previous year) by _from_start.
+        return cls._from_start(isoweek_start(year, n))
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int, month: Optional[int] = None) -> Week:
+        """Create the (ISO) week containing the day with the given ordinal.
+
+           Args:
+               ordinal: The ordinal of a day in the week.
+               month: The month this week is associated with (defaults to
+                   the month of the Monday).
+        """
+        year, num, weekday = isocalendar(ordinal)
+        return cls._from_start(ordinal - weekday + 1, month, year, num)
+
+    @classmethod
+    def _from_start(cls, start: int, month: Optional[int] = None,
+                    year: Optional[int] = None, num: Optional[int] = None) -> Week:
+        """Create the week starting at ordinal `start`, without creating
+           its days (cf. `days`).
+        """
+        self = cls.__new__(cls)
+        if year is None or num is None:
+            # thursday is always in the correct iso-year per definition
+            year, num, _ = isocalendar(start + 3)
+        if month is None:
+            month = datetime.date.fromordinal(start).month  # quite arbitrary
+        self.year = year
+        self.num = num
+        self.month = month
+        self.span = start, start + 7
+        self._days: Optional[List[Day]] = None
+        return self
 
     def __init__(self, days: List[Union[datetime.date, Day]], month: int) -> None:
         """Initialize a Week object.
@@ -80,17 +114,33 @@ class Week:
         """
         super().__init__()
         # thursday is always in the correct iso-year per definition
-        t = days[3].isocalendar()
-        self.year = t[0]
-        self.num = t[1]
-        self.days = [Day(d, membermonth=month) for d in days]
+        thursday = days[3]
+        self.year, self.num, _ = isocalendar(thursday.toordinal(), thursday.year)
+        self._days: Optional[List[Day]] = [Day(d, membermonth=month) for d in days]
         self.month = month
+        start = self._days[0].toordinal()
+        self.span = start, start + 7
+
+    @property
+    def days(self) -> List[Day]:
+        """The seven days of the week (created on first access).
+        """
+        if self._days is None:
+            month = self.month
+            self._days = [Day(datetime.date.fromordinal(n), membermonth=month)
+                          for n in range(*self.span)]
+        return self._days
+
+    def __reduce__(self) -> Tuple[Any, Tuple[int, int, int, int]]:
+        """Deepcopy helper.
+        """
+        return Week._from_start, (self.span[0], self.month, self.year, self.num)
 
     @property
     def current(self) -> bool:
         """Return True if today is in this week.
         """
-        return any(d.today for d in self.days)
+        return self.span[0] <= clock.today_ordinal() < self.span[1]
 
     def idtag(self) -> str:
         """Return a tag representing this week.
@@ -99,22 +149,29 @@ class Week:
         """
         return f'w{self.year}{self.num}'
 
+    def _day(self, i: int) -> Day:
+        """Return day number `i` (0..6) of the week.
+        """
+        if self._days is not None:
+            return self._days[i]
+        return Day(datetime.date.fromordinal(self.span[0] + i), membermonth=self.month)
+
     @property
     def first(self) -> Day:
         """1st day of week.
         """
-        return self.days[0]
+        return self._day(0)
 
     @property
     def last(self) -> Day:
         """Last day of week.
         """
-        return self.days[-1]
+        return self._day(6)
 
     def datetuple(self) -> Tuple[int, int, int]:
         """First day of this week.
         """
-        return self.year, self.month, self.first.day
+        return self.year, self.month, datetime.date.fromordinal(self.span[0]).day
 
     def __str__(self) -> str:
         """Return string representation of the week.
@@ -131,11 +188,42 @@ class Week:
         """
         return iter(self.days)
 
+    def __add__(self, n: int) -> Week:
+        """Add n weeks to self.
+        """
+        return Week._from_start(self.span[0] + 7 * n)
+
+    def __radd__(self, n: int) -> Week:
+        """Add n weeks to self (right addition).
+        """
+        return self + n
+
+    def __sub__(self, n: Union[int, Week]) -> Union[int, Week]:
+        """Subtract n weeks from self, or return the number of weeks
+           between self and the Week `n`.
+        """
+        if isinstance(n, Week):
+            return (self.span[0] - n.span[0]) // 7
+        return self + (-n)
+
+    # rsub doesn't make sense
+
+    def prev(self) -> Week:
+        """Previous week.
+        """
+        return self - 1
+
+    def next(self) -> Week:
+        """Next week.
+        """
+        return self + 1
+
     def until_today(self) -> Iterator[Day]:
         """Yield all days in week that are in the past.
         """
+        today = clock.today_ordinal()
         for d in self.days:
-            if d.today:
+            if d.toordinal() == today:
                 break
             yield d
 
@@ -148,31 +236,26 @@ class Week:
         """Return a pair of datetime objects representing this week
            (as a half-open interval).
         """
-        return self.days[0].rangetuple()[0], self.days[-1].rangetuple()[-1]
+        return (datetime.datetime.fromordinal(self.span[0]),
+                datetime.datetime.fromordinal(self.span[1]))
 
     def __lt__(self, other: Any) -> bool:
         """Compare if this week is less than another time range.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) < 0
+        c = periodcmp(self, other)
+        return c is not None and c < 0
 
     def __le__(self, other: Any) -> bool:
         """Compare if this week is less than or equal to another time range.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) <= 0
+        c = periodcmp(self, other)
+        return c is not None and c <= 0
 
     def __eq__(self, other: Any) -> bool:
         """Compare if this week is equal to another time range.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) == 0
+        c = periodcmp(self, other)
+        return c is not None and c == 0
 
     def __ne__(self, other: Any) -> bool:
         """Compare if this week is not equal to another time range.
@@ -182,18 +265,14 @@ class Week:
     def __gt__(self, other: Any) -> bool:
         """Compare if this week is greater than another time range.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) > 0
+        c = periodcmp(self, other)
+        return c is not None and c > 0
 
     def __ge__(self, other: Any) -> bool:
         """Compare if this week is greater than or equal to another time range.
         """
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) >= 0
+        c = periodcmp(self, other)
+        return c is not None and c >= 0
 
     # def __eq__(self, other):
     #     return self.year == other.year and self.num == other.num
@@ -204,77 +283,146 @@ class Week:
         return self.days[n]
 
     def __contains__(self, date: Any) -> bool:
-        """Check if a date is within this week.
-        """
-        return date in self.days
-
-
-# class Weeks(list):
-#     def __init__(self, start, end):
-#         super(Weeks, self).__init__()
-#         assert start <= end
-#         for i in range(start, end + 1):
-#             self.append(Week.weeknum(i))
-#
-#     def range(self):
-#         """Return an iterator for the range of `self`.
-#         """
-#         return self.dayiter()
-#
-#     def between_tuple(self):  # pylint:disable=E0213
-#         """Return a tuple of datetimes that is convenient for sql
-#            `between` queries.
-#         """
-#         return (self.first.datetime(),
-#                 (self.last + 1).datetime() - datetime.timedelta(seconds=1))
-#
-#     @property
-#     def middle(self):
-#         """Return the day that splits the date range in half.
-#         """
-#         middle = (self.first.toordinal() + self.last.toordinal()) // 2
-#         return Day.fromordinal(middle)
-#
-#     def timetuple(self):
-#         """Create timetuple from datetuple.
-#            (to interact with datetime objects).
-#         """
-#         d = datetime.date(*self.datetuple())
-#         t = datetime.time()
-#         return datetime.datetime.combine(d, t)
-#
-#     @property
-#     def first(self):
-#         """First day in first week.
-#         """
-#         return self[0][0]
-#
-#     @property
-#     def last(self):
-#         """Last day in last week.
-#         """
-#         return self[-1][-1]
-#
-#     def datetuple(self):
-#         """First day of first week.
-#         """
-#         return self.first.datetuple()
-#
-#     def dayiter(self):
-#         """Iterate over all days in all the weeks.
-#         """
-#         for wk in self:
-#             for day in wk:
-#                 yield day
-#
-#     def __repr__(self):
-#         return '[' + ', '.join(map(str, iter(self))) + ']'
+        """Check if a date (or any part of a period) is within this week.
+        """
+        if isinstance(date, datetime.date):
+            return self.span[0] <= date.toordinal() < self.span[1]
+        return periodcmp(self, date) == 0
+
+
+class Weeks(Sequence):
+    """A contiguous range of weeks, from `start` up to and including `end`.
+
+       The Week objects are only created when they are accessed.  Slicing
+       returns another Weeks range.
+    """
+    __slots__ = ('_starts',)
+
+    def __init__(self, start: Union[Week, datetime.date], end: Union[Week, datetime.date]) -> None:
+        """Initialize a Weeks range.
+
+           Args:
+               start: The first week (or a day in it).
+               end: The last week (or a day in it).
+        """
+        start_ordinal = self._start_ordinal(start)
+        end_ordinal = self._start_ordinal(end)
+        if start_ordinal > end_ordinal:
+            raise ValueError(f'start ({start}) must be <= end ({end})')
+        self._starts = range(start_ordinal, end_ordinal + 1, 7)
+
+    @staticmethod
+    def _start_ordinal(w: Union[Week, datetime.date]) -> int:
+        if isinstance(w, Week):
+            return w.span[0]
+        n = w.toordinal()
+        return n - (n - 1) % 7  # ordinal 1 is a Monday
+
+    @classmethod
+    def _from_range(cls, starts: range) -> Weeks:
+        res = cls.__new__(cls)
+        res._starts = starts
+        return res
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, slice):
+            return Weeks._from_range(self._starts[key])
+        return Week._from_start(self._starts[key])
+
+    def __iter__(self) -> Iterator[Week]:
+        return map(Week._from_start, self._starts)
+
+    def _value_start(self, w: Any) -> Optional[int]:
+        """The start ordinal of the week `w` (or the week of the date `w`).
+        """
+        if isinstance(w, Week):
+            return w.span[0]
+        if isinstance(w, datetime.date):
+            return self._start_ordinal(w)
+        return None
+
+    def __contains__(self, w: Any) -> bool:
+        n = self._value_start(w)
+        return n is not None and n in self._starts
+
+    def index(self, w: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """Return the index of the week `w` (or the week of the date `w`).
+        """
+        n = self._value_start(w)
+        if n is None or n not in self._starts[start:stop]:
+            raise ValueError(f'{w!r} is not in Weeks')
+        return self._starts.index(n)
+
+    def count(self, w: Any) -> int:
+        """Return 1 if the week `w` (or the week of the date `w`) is in the
+           range, otherwise 0.
+        """
+        return int(w in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Weeks):
+            return self._starts == other._starts
+        return NotImplemented
+
+    def __ne__(self, other: Any) -> bool:
+        if isinstance(other, Weeks):
+            return self._starts != other._starts
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return '[' + ', '.join(map(str, iter(self))) + ']'
+
+    def range(self) -> Days:
+        """Return an iterator for the range of `self`.
+        """
+        return Days(self.first.first, self.last.last)
+
+    def between_tuple(self) -> Tuple[datetime.datetime, datetime.datetime]:  # pylint:disable=E0213
+        """Return a tuple of datetimes that is convenient for sql
+           `between` queries.
+        """
+        return (self.first.first.datetime(),
+                (self.last.last + 1).datetime() - datetime.timedelta(seconds=1))
+
+    @property
+    def middle(self) -> Day:
+        """Return the day that splits the date range in half.
+        """
+        middle = (self._starts[0] + self._starts[-1] + 6) // 2
+        return Day.fromordinal(middle)
+
+    @property
+    def first(self) -> Week:
+        """The first week.
+        """
+        return self[0]
+
+    @property
+    def last(self) -> Week:
+        """The last week.
+        """
+        return self[-1]
+
+    def datetuple(self) -> Tuple[int, int, int]:
+        """First day of first week.
+        """
+        return self.first.first.datetuple()
+
+    def dayiter(self) -> Iterator[Day]:
+        """Iterate over all days in all the weeks.
+        """
+        return map(Day.fromordinal, range(self._starts[0], self._starts[-1] + 7))
 
 
 def _Week(self: Day) -> Week:
     """Return a Week object representing the week `self` belongs to.
     """
-    return Week.weeknum(self.weeknum, self.isoyear)
+    return Week.from_ordinal(self.toordinal())
 
 
 Day.week = property(_Week)
@@ -2,30 +2,62 @@
 Year class.
 """
 from __future__ import annotations
-from typing import Optional, List, Tuple, Iterator, Any
+from typing import Optional, List, Tuple, Iterator, Any, Union
 import datetime
-from .calfns import chop, rangecmp, rangetuple
+from . import clock
+from .calfns import chop, periodcmp
 from .day import Day
+from .formatter import compile_format
+from .marks import MarkStore
 from .month import Month
 
 
 class Year:  # pylint:disable=too-many-public-methods
     """A single year.
     """
+    __slots__ = ('year', 'span', '_cached_months', '_marks')
     year: int
-    months: List[Month]
+    span: Tuple[int, int]
 
-    def __init__(self, year: Optional[int] = None) -> None:
+    def __init__(self, year: Optional[int] = None, marks: Optional[MarkStore] = None) -> None:
         """Initialize a Year object.
 
            Args:
                year: The year number. If None, uses the current year.
+               marks: Optional mark store (shared with other views of
+                   the same dates, cf. `ttcal.marks`).
         """
         super().__init__()
         if year is None:
-            year = datetime.date.today().year
+            year = clock.today().year
         self.year = year
-        self.months = [Month(year, i + 1) for i in range(12)]
+        self.span = (datetime.date(year, 1, 1).toordinal(),
+                     datetime.date(year, 12, 31).toordinal() + 1)
+        # the months are created on first access (cf. months).
+        self._cached_months: Optional[List[Month]] = None
+        self._marks = marks
+
+    @property
+    def months(self) -> List[Month]:
+        """The twelve months of this year.
+        """
+        if self._cached_months is None:
+            marks = self.marks
+            self._cached_months = [Month(self.year, i + 1, marks=marks) for i in range(12)]
+        return self._cached_months
+
+    @property
+    def marks(self) -> MarkStore:
+        """The mark store of this year, shared with its months.
+        """
+        if self._marks is None:
+            self._marks = MarkStore()
+        return self._marks
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """Deepcopy helper.
+        """
+        return Year, (self.year,)
 
     def __int__(self) -> int:
         """Convert Year to integer representation.
@@ -41,37 +73,32 @@ class Year:  # pylint:disable=too-many-public-methods
         """Return a pair of datetime objects containing year
            (in a half-open interval).
         """
-        return self.first.datetime(), (self + 1).first.datetime()
+        return (datetime.datetime.fromordinal(self.span[0]),
+                datetime.datetime.fromordinal(self.span[1]))
 
     def __lt__(self, other: Any) -> bool:
         """Compare if this year is less than another year or time range.
         """
         if isinstance(other, int):
             return self.year < other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) < 0
+        c = periodcmp(self, other)
+        return c is not None and c < 0
 
     def __le__(self, other: Any) -> bool:
         """Compare if this year is less than or equal to another year or time range.
         """
         if isinstance(other, int):
             return self.year <= other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) <= 0
+        c = periodcmp(self, other)
+        return c is not None and c <= 0
 
     def __eq__(self, other: Any) -> bool:
         """Compare if this year is equal to another year or time range.
         """
         if isinstance(other, int):
             return self.year == other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) == 0
+        c = periodcmp(self, other)
+        return c is not None and c == 0
 
     def __ne__(self, other: Any) -> bool:
         """Compare if this year is not equal to another year or time range.
@@ -83,20 +110,16 @@ class Year:  # pylint:disable=too-many-public-methods
         """
         if isinstance(other, int):
             return self.year > other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) > 0
+        c = periodcmp(self, other)
+        return c is not None and c > 0
 
     def __ge__(self, other: Any) -> bool:
         """Compare if this year is greater than or equal to another year or time range.
         """
         if isinstance(other, int):
             return self.year >= other
-        othr = rangetuple(other)
-        if othr is other:
-            return False
-        return rangecmp(self.rangetuple(), othr) >= 0
+        c = periodcmp(self, other)
+        return c is not None and c >= 0
 
     def timetuple(self) -> datetime.datetime:
         """Returns a datetime at 00:00:00 on January 1st.
@@ -167,13 +190,27 @@ class Year:  # pylint:disable=too-many-public-methods
         """Yield all 'marked' days in year.
         """
         for m in self.months:
-            yield from m.marked_days()
+            for d in m.marked_days():
+                if d.month == m.month and d.year == m.year:
+                    yield d
 
     def datetuple(self) -> Tuple[int, None, None]:
         """January 1.
         """
         return self.year, None, None
 
+    @classmethod
+    def from_serial(cls, serial: int) -> Year:
+        """Create the Year with the given serial (i.e. the year number).
+        """
+        return cls(serial)
+
+    @property
+    def serial(self) -> int:
+        """The serial of a year is the year number (cf. `Month.serial`).
+        """
+        return self.year
+
     def __add__(self, n: int) -> Year:
         """Add n years to self.
         """
@@ -184,9 +221,12 @@ class Year:  # pylint:disable=too-many-public-methods
         """
         return self + n
 
-    def __sub__(self, n: int) -> Year:
-        """Subtract n years from self.
+    def __sub__(self, n: Union[int, Year]) -> Union[int, Year]:
+        """Subtract n years from self, or return the number of years
+           between self and the Year `n`.
         """
+        if isinstance(n, Year):
+            return self.year - n.year
         return self + (-n)
 
     # rsub doesn't make sense
@@ -335,7 +375,7 @@ class Year:  # pylint:disable=too-many-public-methods
     def daycount(self) -> int:
         """Return the number of days in year.
         """
-        return len(self.days())
+        return self.span[1] - self.span[0]
 
     def rows(self) -> Iterator[List[Month]]:
         """Return a year calendar layout (3x4).
@@ -351,13 +391,13 @@ class Year:  # pylint:disable=too-many-public-methods
     def first(self) -> Day:
         """First day of first month.
         """
-        return self.months[0].first
+        return Day(self.year, 1, 1)
 
     @property
     def last(self) -> Day:
         """Last day of last month.
         """
-        return self.months[-1].last
+        return Day(self.year, 12, 31)
 
     def __hash__(self) -> int:
         """Return hash value for this year.
@@ -381,41 +421,26 @@ class Year:  # pylint:disable=too-many-public-methods
         return m[day]
 
     def mark_period(self, p: Any, value: str = 'mark') -> None:
-        """Add a 'mark' to a series (period) of days in year.
+        """Add a 'mark' to a series (period) of days in year (the days
+           outside the year are ignored).
         """
-        d = p.first
-        while d != p.last:
-            self.mark(d, value)
-            d += 1
-        self.mark(p.last, value)
+        start, end = self.span
+        self.marks.mark(max(p.first.toordinal(), start), min(p.last.toordinal() + 1, end), value)
 
     def mark(self, d: Day, value: str = 'mark') -> None:
-        """Add a 'mark' to a day in this year.
-        """
-        try:
-            self[d].mark = value
-        except KeyError:  # pragma:nocover
-            pass
-
-    def _format(self, fmtchars: List[str]) -> Iterator[str]:
-        """Internal formatting helper method.
+        """Add a 'mark' to a day in this year (days outside the year
+           are ignored).
         """
-        # http://blog.tkbe.org/archive/date-filter-cheat-sheet/
-        for ch in fmtchars:
-            if ch == 'y':
-                yield str(self.year)[-2:]
-            elif ch == 'Y':
-                yield str(self.year)
-            else:
-                yield ch
+        n = d.toordinal()
+        if self.span[0] <= n < self.span[1]:
+            self.marks.mark(n, n + 1, value)
 
     def format(self, fmt: Optional[str] = None) -> str:
         """Format according to format string. Default format is four-digit-year.
         """
         if fmt is None:
             fmt = "Y"
-        tmp = list(self._format(list(fmt)))
-        return ''.join(tmp)
+        return compile_format('year', fmt)(self)
 
 
 # noinspection PyPep8Naming